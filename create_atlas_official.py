@@ -25,6 +25,7 @@ import sys
 import json
 import math
 import random
+import hashlib
 import argparse
 from typing import Dict, List, Tuple, Optional
 from enum import Enum
@@ -61,6 +62,51 @@ except ImportError as e:
     print(f"⚠ Warning: Modular texture system not available ({e}). Using basic generation.")
 
 
+def compute_source_fingerprint(data_dir: str, tile_size_px: int, max_grid_size: int) -> str:
+    """
+    Hash everything that determines the atlas output.
+    
+    Covers the texture generator sources, the block JSON data, this script,
+    the modules it takes slot allocation and block mapping from, and the
+    layout settings. If the fingerprint matches the one stored in
+    atlas_metadata.json, the shipped PNG atlases are already up to date.
+    """
+    source_files = [os.path.join(current_dir, 'create_atlas_official.py'),
+                    os.path.join(current_dir, 'atlas_face_system.py'),
+                    os.path.join(current_dir, 'scripts', 'json_to_block_mapping.py')]
+    for folder, extensions in [(texture_generators_path, ('.py', '.c')),
+                               (os.path.join(data_dir, 'blocks'), ('.json',))]:
+        if os.path.isdir(folder):
+            source_files.extend(os.path.join(folder, name) for name in sorted(os.listdir(folder))
+                                if name.endswith(extensions))
+    
+    digest = hashlib.sha256(f"{tile_size_px}:{max_grid_size}".encode())
+    for path in source_files:
+        digest.update(os.path.relpath(path, current_dir).encode())
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def atlases_up_to_date(output_dir: str, fingerprint: str) -> bool:
+    """Check whether the atlases in output_dir were generated from the current sources."""
+    metadata_path = os.path.join(output_dir, "atlas_metadata.json")
+    try:
+        with open(metadata_path, 'r') as f:
+            metadata = json.load(f)
+    except (OSError, ValueError):
+        return False
+    
+    if metadata.get("generation_info", {}).get("source_fingerprint") != fingerprint:
+        return False
+    
+    for atlas_metadata in metadata.get("atlases", {}).values():
+        for file_metadata in atlas_metadata.get("files", []):
+            if not os.path.exists(os.path.join(output_dir, file_metadata["filename"])):
+                return False
+    return True
+
+
 def generate_modular_texture(block_id, block_info, size=32, face='all', seed=None):
     """
     Generate a texture using the modular system for a specific block.
@@ -342,6 +388,7 @@ class DynamicAtlasGenerator:
         # Atlas file management
         self.atlas_files: Dict[AtlasType, List[AtlasFileInfo]] = {}
         self.block_assignments: Dict[int, Tuple[AtlasType, int, int]] = {}  # block_id -> (atlas_type, file_index, slot_index)
+        self._empty_placeholder_tile: Optional[Image.Image] = None
         
         self._calculate_atlas_layout()
         
@@ -479,7 +526,9 @@ class DynamicAtlasGenerator:
             "generation_info": {
                 "tile_size_px": self.tile_size_px,
                 "max_grid_size": self.max_grid_size,
-                "total_blocks": len(self.unified_data)
+                "total_blocks": len(self.unified_data),
+                "source_fingerprint": compute_source_fingerprint(
+                    self.data_dir, self.tile_size_px, self.max_grid_size)
             },
             "atlases": {}
         }
@@ -621,8 +670,6 @@ class DynamicAtlasGenerator:
     
     def _generate_placeholder(self, atlas_image: Image.Image, x0: int, y0: int, atlas_type: AtlasType):
         """Generate a placeholder texture for missing blocks"""
-        draw = ImageDraw.Draw(atlas_image)
-        
         # Different colors for different atlas types
         colors = {
             AtlasType.MAIN: (200, 100, 100, 255),    # Red
@@ -632,33 +679,37 @@ class DynamicAtlasGenerator:
         
         color = colors.get(atlas_type, (128, 128, 128, 255))
         
-        # Fill with solid color
-        draw.rectangle([x0, y0, x0 + self.tile_size_px - 1, y0 + self.tile_size_px - 1], 
-                      fill=color)
+        # Solid color tile - Image.new fills it without going through ImageDraw
+        tile = Image.new('RGBA', (self.tile_size_px, self.tile_size_px), color)
+        draw = ImageDraw.Draw(tile)
         
         # Add texture pattern
+        darker = tuple(max(0, c - 40) for c in color[:3]) + (255,)
         for i in range(0, self.tile_size_px, 4):
             for j in range(0, self.tile_size_px, 4):
                 if (i + j) % 8 == 0:
-                    darker = tuple(max(0, c - 40) for c in color[:3]) + (255,)
-                    draw.rectangle([x0 + i, y0 + j, x0 + i + 2, y0 + j + 2], fill=darker)
+                    draw.rectangle([i, j, i + 2, j + 2], fill=darker)
+        
+        atlas_image.paste(tile, (x0, y0))
     
     def _generate_empty_placeholder(self, atlas_image: Image.Image, x0: int, y0: int):
         """Generate placeholder for unused atlas slots"""
-        draw = ImageDraw.Draw(atlas_image)
-        
-        # Light gray with diagonal lines to show it's unused
-        fill_color = (64, 64, 64, 128)
-        line_color = (32, 32, 32, 128)
-        
-        # Fill background
-        draw.rectangle([x0, y0, x0 + self.tile_size_px - 1, y0 + self.tile_size_px - 1], 
-                      fill=fill_color)
+        # Every unused slot looks the same, so build the tile once
+        if self._empty_placeholder_tile is None:
+            # Light gray with diagonal lines to show it's unused
+            fill_color = (64, 64, 64, 128)
+            line_color = (32, 32, 32, 128)
+            
+            tile = Image.new('RGBA', (self.tile_size_px, self.tile_size_px), fill_color)
+            draw = ImageDraw.Draw(tile)
+            
+            # Diagonal lines (clipped to the tile instead of spilling into neighbours)
+            for i in range(-self.tile_size_px, self.tile_size_px, 8):
+                draw.line([i, 0, i + self.tile_size_px, self.tile_size_px], 
+                         fill=line_color, width=1)
+            self._empty_placeholder_tile = tile
         
-        # Diagonal lines
-        for i in range(-self.tile_size_px, self.tile_size_px, 8):
-            draw.line([x0 + i, y0, x0 + i + self.tile_size_px, y0 + self.tile_size_px], 
-                     fill=line_color, width=1)
+        atlas_image.paste(self._empty_placeholder_tile, (x0, y0))
     
     def _generate_debug_atlas(self, file_info: AtlasFileInfo, output_path: str) -> None:
         """Generate debug version of atlas with 3x zoom, block names, IDs and coordinates overlaid"""
@@ -778,12 +829,21 @@ def main():
                        help='Maximum grid size (default: 16)')
     parser.add_argument('--output-dir', type=str, default='assets/textures/',
                        help='Output directory (default: assets/textures/)')
+    parser.add_argument('--if-changed', action='store_true',
+                       help='Skip generation when the shipped atlases match the current '
+                            'generator sources and block data')
     
     args = parser.parse_args()
     
     print("🚀 Dynamic Multi-File Atlas Generator")
     print("=" * 50)
     
+    if args.if_changed and not args.debug:
+        fingerprint = compute_source_fingerprint("data", args.tile_size, args.max_grid)
+        if atlases_up_to_date(args.output_dir, fingerprint):
+            print(f"✅ Atlases in {args.output_dir} are up to date - skipping generation")
+            return True
+    
     if args.debug:
         print("🐛 Debug mode enabled - will generate debug atlases with IDs")
     
@@ -16,15 +16,15 @@ import subprocess
 from pathlib import Path
 from datetime import datetime
 
-def run_generator(script_path: Path, description: str, project_root: Path) -> bool:
+def run_generator(script_path: Path, description: str, project_root: Path, args: list = ()) -> bool:
     """Run a generator script and return success status"""
     print(f"\n🔨 {description}")
-    print(f"   Running: {script_path}")
+    print(f"   Running: {script_path} {' '.join(args)}".rstrip())
     
     try:
         # Run the script
         result = subprocess.run([
-            sys.executable, str(script_path)
+            sys.executable, str(script_path), *args
         ], capture_output=True, text=True, cwd=project_root)
         
         if result.returncode == 0:
@@ -65,11 +65,12 @@ def main():
     print(f"Project root: {project_root}")
     
     # Define generation steps
+    # The atlas step is skipped when the shipped PNGs match the current sources
     generators = [
-        (script_dir / "id_manager.py", "ID Registry Management"),
-        (script_dir / "cpp_generator.py", "C++ Code Generation"),
-        (script_dir / "python_generator.py", "Python Code Generation"),
-        (project_root / "create_atlas_official.py", "Texture Atlas Generation"),
+        (script_dir / "id_manager.py", "ID Registry Management", []),
+        (script_dir / "cpp_generator.py", "C++ Code Generation", []),
+        (script_dir / "python_generator.py", "Python Code Generation", []),
+        (project_root / "create_atlas_official.py", "Texture Atlas Generation", ["--if-changed"]),
     ]
     
     # Track results
@@ -77,14 +78,14 @@ def main():
     total_start = datetime.now()
     
     # Run each generator
-    for script_path, description in generators:
+    for script_path, description, args in generators:
         if not script_path.exists():
             print(f"❌ Generator script not found: {script_path}")
             results.append(False)
             continue
             
         step_start = datetime.now()
-        success = run_generator(script_path, description, project_root)
+        success = run_generator(script_path, description, project_root, args)
         step_duration = datetime.now() - step_start
         results.append(success)
         
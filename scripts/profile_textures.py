@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Texture Generation Profiler
+Runs the stone texture generators under cProfile and prints where the time goes.
+
+Usage:
+    python scripts/profile_textures.py [--size 16] [--rounds 50] [--output textures.prof]
+
+Inspect the saved profile afterwards with: python -m pstats textures.prof
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+
+# Make the texture_generators package importable when run from anywhere
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from texture_generators.stone_textures_enhanced import (
+    generate_stone_texture, generate_processed_stone_texture, clear_texture_cache
+)
+
+STONE_TYPES = [
+    'granite', 'marble', 'limestone', 'sandstone', 'slate', 'obsidian', 'basalt',
+    'quartzite', 'pumice', 'shale', 'gravel', 'desert_rock', 'bedrock',
+    'cobblestone', 'smooth_stone', 'flagstone'
+]
+PROCESSED_TYPES = [
+    'stone_brick', 'cobblestone', 'granite_brick', 'marble_tile',
+    'polished_stone', 'smooth_granite', 'chiseled_stone'
+]
+
+def run_workload(size: int, rounds: int) -> None:
+    """Generate every stone and processed stone texture once per round."""
+    for seed in range(rounds):
+        # Cached renders would hide the generator cost
+        clear_texture_cache()
+        for stone_type in STONE_TYPES:
+            generate_stone_texture(size, stone_type, seed=seed)
+        for processed_type in PROCESSED_TYPES:
+            generate_processed_stone_texture(size, processed_type)
+
+def main():
+    parser = argparse.ArgumentParser(description='Profile stone texture generation')
+    parser.add_argument('--size', type=int, default=16, help='Texture size in pixels')
+    parser.add_argument('--rounds', type=int, default=50, help='Times to generate the full set')
+    parser.add_argument('--output', default='textures.prof', help='Where to save the cProfile data')
+    parser.add_argument('--top', type=int, default=20, help='Number of functions to print')
+    args = parser.parse_args()
+
+    profiler = cProfile.Profile()
+    profiler.runcall(run_workload, args.size, args.rounds)
+    profiler.dump_stats(args.output)
+
+    print(f"Profile saved to {args.output}")
+    pstats.Stats(profiler).sort_stats('tottime').print_stats(args.top)
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,87 @@ These patterns form the foundation for creating various block textures.
 """
 
 import random
-from PIL import ImageDraw
-from typing import Tuple, Callable, List
+import numpy as np
+from PIL import Image, ImageDraw
+from typing import Tuple, Callable, List, Optional, Sequence
 from texture_generators.color_palettes import Color, ColorPalette, vary_color, blend_colors
 
+try:
+    from texture_generators import _speckle
+except ImportError:
+    # C kernel not built (see texture_generators/setup.py) - use the NumPy path
+    _speckle = None
+
+# ========== SCATTER KERNEL ==========
+
+def _threshold_to_u32(threshold: float) -> int:
+    """Convert a [0, 1] probability into a uint32 comparison threshold."""
+    return max(0, min(0xFFFFFFFF, int(threshold * 4294967296.0)))
+
+def _mix32(x: np.ndarray) -> np.ndarray:
+    """Stateless 32-bit hash, identical to mix32() in _speckle.c."""
+    x = x ^ (x >> np.uint32(16))
+    x = x * np.uint32(0x7feb352d)
+    x = x ^ (x >> np.uint32(15))
+    x = x * np.uint32(0x846ca68b)
+    x = x ^ (x >> np.uint32(16))
+    return x
+
+def fill_speckles(tile, size: int, stride: int, palette: Sequence[Color],
+                  thresholds: Sequence[float], seed: int) -> None:
+    """
+    Writes a size x size RGBA speckle tile into a writable buffer.
+    
+    Each pixel hashes (seed, pixel index) to a uint32 and picks the first
+    palette color whose cumulative threshold it falls under; the last palette
+    color is used for everything above the final threshold.
+    
+    Args:
+        tile: Writable buffer (bytearray, numpy array) holding RGBA rows
+        stride: Bytes between the starts of consecutive rows
+        palette: RGBA colors, one more than there are thresholds
+        thresholds: Increasing cumulative probabilities in [0, 1]
+        seed: 32-bit seed; same seed always gives the same tile
+    """
+    palette_bytes = bytes(channel for color in palette for channel in (tuple(color) + (255,))[:4])
+    limits = [_threshold_to_u32(t) for t in thresholds]
+    seed &= 0xFFFFFFFF
+    
+    if _speckle is not None:
+        _speckle.fill_speckles(tile, size, stride, palette_bytes, limits, seed)
+        return
+    
+    index = np.arange(size * size, dtype=np.uint32)
+    hashed = _mix32(index * np.uint32(0x9e3779b9) + np.uint32(seed))
+    classes = np.searchsorted(np.array(limits, dtype=np.uint32), hashed, side='right')
+    colors = np.frombuffer(palette_bytes, dtype=np.uint8).reshape(-1, 4)
+    view = np.ndarray((size, size, 4), dtype=np.uint8, buffer=tile, strides=(stride, 4, 1))
+    view[...] = colors[classes].reshape(size, size, 4)
+
+def _blit_tile(draw: ImageDraw.Draw, tile, x0: int, y0: int, size: int) -> None:
+    """Copies a packed RGBA tile buffer into the image behind draw."""
+    tile_image = Image.frombuffer('RGBA', (size, size), tile, 'raw', 'RGBA', 0, 1)
+    if draw.im.mode != 'RGBA':
+        tile_image = tile_image.convert(draw.im.mode)
+    draw.im.paste(tile_image.im, (x0, y0, x0 + size, y0 + size))
+
+def paste_array(draw: ImageDraw.Draw, arr: np.ndarray, x0: int, y0: int) -> None:
+    """Pastes a contiguous (size, size, 4) RGBA array into the image behind draw."""
+    _blit_tile(draw, arr, x0, y0, arr.shape[0])
+
+def draw_color_points(draw: ImageDraw.Draw, colored_points: dict) -> None:
+    """
+    Draws an {(x, y): color} mapping with one draw.point call per color.
+    
+    Fill the mapping in drawing order: assigning a pixel again replaces its
+    color, just as a later single-point draw would have.
+    """
+    by_color = {}
+    for xy, color in colored_points.items():
+        by_color.setdefault(color, []).append(xy)
+    for color, points in by_color.items():
+        draw.point(points, fill=color)
+
 # ========== CORE PATTERN FUNCTIONS ==========
 
 def draw_speckled_pattern(draw: ImageDraw.Draw, x0: int, y0: int, size: int, 
@@ -24,24 +101,35 @@ def draw_speckled_pattern(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
         density: Higher number = fewer speckles (size*size // density)
         variation: Color variation range for speckles
     """
+    tile = np.empty((size, size, 4), dtype=np.uint8)
+    speckle_array(tile, palette, density, variation)
+    _blit_tile(draw, tile, x0, y0, size)
+
+def speckle_array(arr: np.ndarray, palette: ColorPalette, density: int = 8,
+                  variation: int = 20, seed: Optional[int] = None) -> None:
+    """
+    Array version of draw_speckled_pattern: fills a contiguous (size, size, 4)
+    uint8 array in place with the base color plus speckles.
+    
+    Args:
+        seed: Speckle seed; drawn from the random module when None
+    """
     base_color = palette.get('base', (128, 128, 128, 255))
     dark_color = palette.get('dark_speckle', vary_color(base_color, -30))
     light_color = palette.get('light_speckle', vary_color(base_color, 30))
     
-    # Fill base
-    draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=base_color)
+    if variation > 0:
+        dark_color = vary_color(dark_color, variation)
+        light_color = vary_color(light_color, variation)
     
-    # Add speckles
-    num_speckles = (size * size) // density
-    for _ in range(num_speckles):
-        sx = random.randint(x0, x0 + size - 1)
-        sy = random.randint(y0, y0 + size - 1)
-        
-        speckle_color = random.choice([dark_color, light_color])
-        if variation > 0:
-            speckle_color = vary_color(speckle_color, variation)
-        
-        draw.point((sx, sy), fill=speckle_color)
+    if seed is None:
+        seed = random.getrandbits(32)
+    
+    # Base fill and speckles in one pass: each pixel is dark or light with
+    # probability 1/(2*density), which matches size*size // density speckles
+    speckle_chance = 1.0 / (2 * density)
+    fill_speckles(arr, arr.shape[0], arr.strides[0], [dark_color, light_color, base_color],
+                  [speckle_chance, 2 * speckle_chance], seed)
 
 def draw_grain_pattern(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
                       palette: ColorPalette, grain_direction: str = 'vertical',
@@ -63,31 +151,36 @@ def draw_grain_pattern(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=base_color)
     
     # Draw grain lines
+    grain_colors = (dark_grain, light_grain)
     num_lines = size // 3 + random.randint(-1, 1)
     for i in range(num_lines):
-        line_color = random.choice([dark_grain, light_grain])
+        line_color = random.choice(grain_colors)
         
         if grain_direction == 'vertical':
             base_x = x0 + (size // num_lines) * i
             line_x = base_x + random.randint(-line_variation, line_variation)
             line_x = max(x0, min(line_x, x0 + size - 1))
             
-            # Draw wavy vertical line
+            # Draw wavy vertical line as one point batch
+            points = []
             for y in range(y0, y0 + size):
                 offset = random.randint(-line_variation//2, line_variation//2)
                 px = max(x0, min(x0 + size - 1, line_x + offset))
-                draw.point((px, y), fill=line_color)
+                points.append((px, y))
+            draw.point(points, fill=line_color)
                 
         elif grain_direction == 'horizontal':
             base_y = y0 + (size // num_lines) * i
             line_y = base_y + random.randint(-line_variation, line_variation)
             line_y = max(y0, min(line_y, y0 + size - 1))
             
-            # Draw wavy horizontal line
+            # Draw wavy horizontal line as one point batch
+            points = []
             for x in range(x0, x0 + size):
                 offset = random.randint(-line_variation//2, line_variation//2)
                 py = max(y0, min(y0 + size - 1, line_y + offset))
-                draw.point((x, py), fill=line_color)
+                points.append((x, py))
+            draw.point(points, fill=line_color)
     
     # Occasionally add knots
     if random.random() < 0.15:  # 15% chance
@@ -100,6 +193,55 @@ def draw_grain_pattern(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
             (knot_x + knot_radius, knot_y + knot_radius)
         ], fill=knot_color)
 
+def grain_array(arr: np.ndarray, palette: ColorPalette, grain_direction: str = 'vertical',
+                line_variation: int = 2) -> None:
+    """
+    Array version of draw_grain_pattern for a whole tile: fills a (size, size, 4)
+    uint8 array in place.
+    
+    Draws from the random module exactly as draw_grain_pattern does at
+    x0 = y0 = 0 on a canvas of the tile's size, so both give the same tile
+    for the same random state.
+    """
+    size = arr.shape[0]
+    base_color = palette.get('base', (160, 120, 80, 255))
+    dark_grain = palette.get('grain_dark', vary_color(base_color, -40))
+    light_grain = palette.get('grain_light', vary_color(base_color, 30))
+    knot_color = palette.get('knot', vary_color(base_color, -60))
+    
+    arr[:] = base_color
+    
+    # Grain lines; the per-pixel waviness keeps its randint calls so the
+    # random stream matches draw_grain_pattern
+    grain_colors = (dark_grain, light_grain)
+    num_lines = size // 3 + random.randint(-1, 1)
+    coords = np.arange(size)
+    for i in range(num_lines):
+        line_color = random.choice(grain_colors)
+        
+        if grain_direction in ('vertical', 'horizontal'):
+            line_pos = (size // num_lines) * i + random.randint(-line_variation, line_variation)
+            line_pos = max(0, min(line_pos, size - 1))
+            offsets = np.array([random.randint(-line_variation//2, line_variation//2) for _ in range(size)])
+            wave = np.clip(line_pos + offsets, 0, size - 1)
+            if grain_direction == 'vertical':
+                arr[coords, wave] = line_color
+            else:
+                arr[wave, coords] = line_color
+    
+    # Occasionally add knots; rare enough to rasterize through PIL
+    if random.random() < 0.15:  # 15% chance
+        knot_x = random.randint(size//4, 3*size//4)
+        knot_y = random.randint(size//4, 3*size//4)
+        knot_radius = random.randint(1, max(1, size//6))
+        
+        knot_image = Image.fromarray(arr)
+        ImageDraw.Draw(knot_image).ellipse([
+            (knot_x - knot_radius, knot_y - knot_radius),
+            (knot_x + knot_radius, knot_y + knot_radius)
+        ], fill=knot_color)
+        arr[:] = np.asarray(knot_image)
+
 def draw_crystalline_pattern(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
                            palette: ColorPalette, crystal_count: int = 3) -> None:
     """
@@ -166,9 +308,10 @@ def draw_mottled_pattern(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
     
     # Add mottled patches
     num_mottles = (size * size) // mottle_density
+    mottle_colors = (highlight_color, shadow_color)
     
     for _ in range(num_mottles):
-        mottle_color = random.choice([highlight_color, shadow_color])
+        mottle_color = random.choice(mottle_colors)
         
         # Random mottle shape and size
         mx = random.randint(x0, x0 + size - 3)
@@ -183,31 +326,39 @@ def draw_mottled_pattern(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
         draw.rectangle([mx, my, mx + mw - 1, my + mh - 1], fill=mottle_color)
 
 def draw_vein_pattern(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
-                     palette: ColorPalette, vein_count: int = 2) -> None:
+                     palette: ColorPalette, vein_count: int = 2,
+                     rng: Optional[random.Random] = None) -> None:
     """
     Draws mineral veins or cracks through material.
     Perfect for: Marble, ore veins, cracked materials.
+    
+    Args:
+        rng: Random source to draw from (defaults to the random module)
     """
+    rng = rng or random
     base_color = palette.get('base', (200, 200, 200, 255))
     vein_color = palette.get('vein_dark', vary_color(base_color, -50))
     
     # Fill base
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=base_color)
     
-    # Draw veins
+    # Draw veins; every vein shares one color, so all points go out in a
+    # single call at the end
+    coin = (True, False)
+    points = []
     for _ in range(vein_count):
         # Random starting point on edge
-        if random.choice([True, False]):
+        if rng.choice(coin):
             # Start from left/right edge
-            start_x = x0 if random.choice([True, False]) else x0 + size - 1
-            start_y = random.randint(y0, y0 + size - 1)
+            start_x = x0 if rng.choice(coin) else x0 + size - 1
+            start_y = rng.randint(y0, y0 + size - 1)
             end_x = x0 + size - 1 if start_x == x0 else x0
-            end_y = random.randint(y0, y0 + size - 1)
+            end_y = rng.randint(y0, y0 + size - 1)
         else:
             # Start from top/bottom edge
-            start_x = random.randint(x0, x0 + size - 1)
-            start_y = y0 if random.choice([True, False]) else y0 + size - 1
-            end_x = random.randint(x0, x0 + size - 1)
+            start_x = rng.randint(x0, x0 + size - 1)
+            start_y = y0 if rng.choice(coin) else y0 + size - 1
+            end_x = rng.randint(x0, x0 + size - 1)
             end_y = y0 + size - 1 if start_y == y0 else y0
         
         # Draw curved vein
@@ -221,23 +372,75 @@ def draw_vein_pattern(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
             
             # Add some curve variation
             variation = size // 8
-            vx += random.randint(-variation, variation)
-            vy += random.randint(-variation, variation)
+            vx += rng.randint(-variation, variation)
+            vy += rng.randint(-variation, variation)
             
             # Clamp to bounds
             vx = max(x0, min(x0 + size - 1, vx))
             vy = max(y0, min(y0 + size - 1, vy))
             
-            # Draw vein point (could be thicker for larger sizes)
-            draw.point((vx, vy), fill=vein_color)
+            # Collect vein point (could be thicker for larger sizes)
+            points.append((vx, vy))
             
             # Occasionally make vein thicker
-            if size > 8 and random.random() < 0.3:
+            if size > 8 and rng.random() < 0.3:
                 for dx in [-1, 0, 1]:
                     for dy in [-1, 0, 1]:
                         px = max(x0, min(x0 + size - 1, vx + dx))
                         py = max(y0, min(y0 + size - 1, vy + dy))
-                        draw.point((px, py), fill=vein_color)
+                        points.append((px, py))
+    draw.point(points, fill=vein_color)
+
+def vein_array(arr: np.ndarray, palette: ColorPalette, vein_count: int = 2,
+               rng: Optional[np.random.Generator] = None, fill_base: bool = True) -> None:
+    """
+    Array version of draw_vein_pattern: fills a (size, size, 4) uint8 array
+    in place with the base color plus veins.
+    
+    Args:
+        rng: NumPy generator to draw from (a fresh default_rng() when None)
+        fill_base: Fill with the base color first; pass False to draw the
+                   veins over what is already in arr
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    size = arr.shape[0]
+    last = size - 1
+    base_color = palette.get('base', (200, 200, 200, 255))
+    vein_color = palette.get('vein_dark', vary_color(base_color, -50))
+    
+    # Fill base
+    if fill_base:
+        arr[:] = base_color
+    
+    steps = max(size, 8)
+    variation = size // 8
+    t = np.arange(steps + 1) / steps
+    
+    # Every random number for every vein, drawn up front in four batches
+    from_side, from_low = rng.integers(0, 2, size=(2, vein_count, 1))
+    start, end = rng.integers(0, size, size=(2, vein_count, 1))
+    jitter = rng.integers(-variation, variation + 1, size=(2, vein_count, steps + 1))
+    thick = rng.random((vein_count, steps + 1)) < 0.3
+    
+    # Random starting point on edge: left/right or top/bottom
+    edge = np.where(from_low, 0, last)
+    start_x = np.where(from_side, edge, start)
+    start_y = np.where(from_side, start, edge)
+    end_x = np.where(from_side, last - edge, end)
+    end_y = np.where(from_side, end, last - edge)
+    
+    # Straight line between the edges plus per-step curve variation, for
+    # all veins at once (one row per vein)
+    vx = np.clip((start_x + t * (end_x - start_x)).astype(np.intp) + jitter[0], 0, last)
+    vy = np.clip((start_y + t * (end_y - start_y)).astype(np.intp) + jitter[1], 0, last)
+    arr[vy, vx] = vein_color
+    
+    # Occasionally make vein thicker
+    if size > 8:
+        tx, ty = vx[thick], vy[thick]
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                arr[np.clip(ty + dy, 0, last), np.clip(tx + dx, 0, last)] = vein_color
 
 def draw_fluid_pattern(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
                       palette: ColorPalette, wave_count: int = 3) -> None:
@@ -253,11 +456,13 @@ def draw_fluid_pattern(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=base_color)
     
     # Draw flowing waves
+    wave_colors = (light_color, dark_color)
     for i in range(wave_count):
         wave_y = y0 + (size // (wave_count + 1)) * (i + 1)
-        wave_color = random.choice([light_color, dark_color])
+        wave_color = random.choice(wave_colors)
         
-        # Draw wavy horizontal line
+        # Draw wavy horizontal line as one point batch
+        points = []
         for x in range(x0, x0 + size):
             # Simple wave function
             wave_offset = int(2 * ((x - x0) / size) * 3.14159)  # Simplified sine wave
@@ -266,7 +471,8 @@ def draw_fluid_pattern(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
             wy = wave_y + wave_y_offset + random.randint(-1, 1)
             wy = max(y0, min(y0 + size - 1, wy))
             
-            draw.point((x, wy), fill=wave_color)
+            points.append((x, wy))
+        draw.point(points, fill=wave_color)
 
 def draw_brick_pattern(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
                       palette: ColorPalette, brick_width: int = 8, brick_height: int = 4,
@@ -9,7 +9,7 @@ Designed for 25cm×25cm voxel scale for enhanced detail.
 
 from PIL import ImageDraw
 import random
-from texture_generators.base_patterns import draw_brick_pattern, draw_speckled_pattern
+from texture_generators.base_patterns import draw_brick_pattern, draw_speckled_pattern, draw_color_points
 from texture_generators.color_palettes import get_palette, vary_color
 
 def generate_clay_brick(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
@@ -71,16 +71,18 @@ def generate_terracotta(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> No
     draw_speckled_pattern(draw, x0, y0, size, palette, density=6, variation=15)
     
     # Add firing marks and color variations
+    points = {}
     for _ in range(size * size // 10):
         tx = random.randint(x0, x0 + size - 1)
         ty = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.4:
-            draw.point((tx, ty), fill=palette['light'])
+            points[tx, ty] = palette['light']
         elif random.random() < 0.6:
-            draw.point((tx, ty), fill=palette['dark'])
+            points[tx, ty] = palette['dark']
         else:
-            draw.point((tx, ty), fill=palette['earth'])
+            points[tx, ty] = palette['earth']
+    draw_color_points(draw, points)
 
 def generate_glazed_tile_white(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """White glazed tile with smooth, reflective surface."""
@@ -95,16 +97,18 @@ def generate_glazed_tile_white(draw: ImageDraw.Draw, x0: int, y0: int, size: int
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add subtle glazed surface variations
+    points = {}
     for _ in range(size * size // 15):
         gx = random.randint(x0, x0 + size - 1)
         gy = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.3:
-            draw.point((gx, gy), fill=palette['light'])
+            points[gx, gy] = palette['light']
         elif random.random() < 0.5:
-            draw.point((gx, gy), fill=palette['dark'])
+            points[gx, gy] = palette['dark']
         elif random.random() < 0.7:
-            draw.point((gx, gy), fill=palette['reflection'])
+            points[gx, gy] = palette['reflection']
+    draw_color_points(draw, points)
 
 def generate_glazed_tile_red(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Red glazed tile with glossy ceramic surface."""
@@ -119,16 +123,18 @@ def generate_glazed_tile_red(draw: ImageDraw.Draw, x0: int, y0: int, size: int)
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add glazed surface texture
+    points = {}
     for _ in range(size * size // 12):
         rx = random.randint(x0, x0 + size - 1)
         ry = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.3:
-            draw.point((rx, ry), fill=palette['light'])
+            points[rx, ry] = palette['light']
         elif random.random() < 0.5:
-            draw.point((rx, ry), fill=palette['dark'])
+            points[rx, ry] = palette['dark']
         elif random.random() < 0.7:
-            draw.point((rx, ry), fill=palette['gloss'])
+            points[rx, ry] = palette['gloss']
+    draw_color_points(draw, points)
 
 def generate_glazed_tile_blue(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Blue glazed tile with deep ceramic coloring."""
@@ -143,16 +149,18 @@ def generate_glazed_tile_blue(draw: ImageDraw.Draw, x0: int, y0: int, size: int)
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add glazed surface texture
+    points = {}
     for _ in range(size * size // 12):
         bx = random.randint(x0, x0 + size - 1)
         by = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.3:
-            draw.point((bx, by), fill=palette['light'])
+            points[bx, by] = palette['light']
         elif random.random() < 0.5:
-            draw.point((bx, by), fill=palette['dark'])
+            points[bx, by] = palette['dark']
         elif random.random() < 0.7:
-            draw.point((bx, by), fill=palette['azure'])
+            points[bx, by] = palette['azure']
+    draw_color_points(draw, points)
 
 def generate_glazed_tile_green(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Green glazed tile with natural ceramic finish."""
@@ -167,16 +175,18 @@ def generate_glazed_tile_green(draw: ImageDraw.Draw, x0: int, y0: int, size: int
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add glazed surface texture
+    points = {}
     for _ in range(size * size // 12):
         gx = random.randint(x0, x0 + size - 1)
         gy = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.3:
-            draw.point((gx, gy), fill=palette['light'])
+            points[gx, gy] = palette['light']
         elif random.random() < 0.5:
-            draw.point((gx, gy), fill=palette['dark'])
+            points[gx, gy] = palette['dark']
         elif random.random() < 0.7:
-            draw.point((gx, gy), fill=palette['jade'])
+            points[gx, gy] = palette['jade']
+    draw_color_points(draw, points)
 
 def generate_porcelain(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Fine porcelain with smooth, translucent-looking surface."""
@@ -191,16 +201,18 @@ def generate_porcelain(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> Non
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add very subtle surface variations
+    points = {}
     for _ in range(size * size // 20):
         px = random.randint(x0, x0 + size - 1)
         py = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.4:
-            draw.point((px, py), fill=palette['light'])
+            points[px, py] = palette['light']
         elif random.random() < 0.6:
-            draw.point((px, py), fill=palette['shadow'])
+            points[px, py] = palette['shadow']
         elif random.random() < 0.8:
-            draw.point((px, py), fill=palette['translucent'])
+            points[px, py] = palette['translucent']
+    draw_color_points(draw, points)
 
 def generate_stoneware(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Stoneware with sturdy, matte ceramic finish."""
@@ -218,16 +230,18 @@ def generate_stoneware(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> Non
     draw_speckled_pattern(draw, x0, y0, size, palette, density=8, variation=10)
     
     # Add additional texture variations
+    points = {}
     for _ in range(size * size // 10):
         sx = random.randint(x0, x0 + size - 1)
         sy = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.4:
-            draw.point((sx, sy), fill=palette['light'])
+            points[sx, sy] = palette['light']
         elif random.random() < 0.6:
-            draw.point((sx, sy), fill=palette['dark'])
+            points[sx, sy] = palette['dark']
         else:
-            draw.point((sx, sy), fill=palette['speckle'])
+            points[sx, sy] = palette['speckle']
+    draw_color_points(draw, points)
 
 def generate_earthenware(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Earthenware with rustic, unglazed ceramic finish."""
@@ -245,16 +259,18 @@ def generate_earthenware(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> N
     draw_speckled_pattern(draw, x0, y0, size, palette, density=5, variation=20)
     
     # Add rustic surface variations
+    points = {}
     for _ in range(size * size // 8):
         ex = random.randint(x0, x0 + size - 1)
         ey = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.3:
-            draw.point((ex, ey), fill=palette['light'])
+            points[ex, ey] = palette['light']
         elif random.random() < 0.5:
-            draw.point((ex, ey), fill=palette['dark'])
+            points[ex, ey] = palette['dark']
         else:
-            draw.point((ex, ey), fill=palette['rough'])
+            points[ex, ey] = palette['rough']
+    draw_color_points(draw, points)
 
 def generate_ceramic_tile(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """General ceramic tile with clean, modern finish."""
@@ -269,16 +285,18 @@ def generate_ceramic_tile(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add clean ceramic surface
+    points = {}
     for _ in range(size * size // 15):
         tx = random.randint(x0, x0 + size - 1)
         ty = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.3:
-            draw.point((tx, ty), fill=palette['light'])
+            points[tx, ty] = palette['light']
         elif random.random() < 0.5:
-            draw.point((tx, ty), fill=palette['dark'])
+            points[tx, ty] = palette['dark']
         elif random.random() < 0.7:
-            draw.point((tx, ty), fill=palette['edge'])
+            points[tx, ty] = palette['edge']
+    draw_color_points(draw, points)
 
 def generate_raw_clay(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Generate raw clay texture - smooth, natural earth tones."""
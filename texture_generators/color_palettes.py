@@ -250,45 +250,47 @@ MAGICAL_ENERGY = {
 
 # ========== PALETTE UTILITIES ==========
 
+# Material name -> palette lookup table used by get_palette()
+_PALETTES_BY_NAME = {
+    'stone_basic': STONE_BASIC,
+    'granite': GRANITE,
+    'marble': MARBLE,
+    'limestone': LIMESTONE,
+    'sandstone': SANDSTONE,
+    'slate': SLATE,
+    'obsidian': OBSIDIAN,
+    'oak_wood': OAK_WOOD,
+    'pine_wood': PINE_WOOD,
+    'birch_wood': BIRCH_WOOD,
+    'mahogany_wood': MAHOGANY_WOOD,
+    'hardwood_wood': HARDWOOD_WOOD,
+    'bamboo_plank_wood': BAMBOO_PLANK_WOOD,
+    'cork_wood': CORK_WOOD,
+    'coal_ore': COAL_ORE,
+    'iron_ore': IRON_ORE,
+    'copper_ore': COPPER_ORE,
+    'gold_ore': GOLD_ORE,
+    'oak_leaves': OAK_LEAVES,
+    'pine_leaves': PINE_LEAVES,
+    'birch_leaves': BIRCH_LEAVES,
+    'water': WATER,
+    'lava': LAVA,
+    'dirt': DIRT,
+    'grass': GRASS,
+    'sand': SAND,
+    'crystal_clear': CRYSTAL_CLEAR,
+    'magical_energy': MAGICAL_ENERGY,
+    'dirt_brown': DIRT_BROWN,
+    'grass_green': GRASS_GREEN,
+    'sand_yellow': SAND_YELLOW,
+    'bedrock_dark': BEDROCK_DARK,
+    'topsoil_rich': TOPSOIL_RICH,
+    'subsoil_pale': SUBSOIL_PALE
+}
+
 def get_palette(material_name: str) -> ColorPalette:
     """Get a color palette by material name."""
-    palettes = {
-        'stone_basic': STONE_BASIC,
-        'granite': GRANITE,
-        'marble': MARBLE,
-        'limestone': LIMESTONE,
-        'sandstone': SANDSTONE,
-        'slate': SLATE,
-        'obsidian': OBSIDIAN,
-        'oak_wood': OAK_WOOD,
-        'pine_wood': PINE_WOOD,
-        'birch_wood': BIRCH_WOOD,
-        'mahogany_wood': MAHOGANY_WOOD,
-        'hardwood_wood': HARDWOOD_WOOD,
-        'bamboo_plank_wood': BAMBOO_PLANK_WOOD,
-        'cork_wood': CORK_WOOD,
-        'coal_ore': COAL_ORE,
-        'iron_ore': IRON_ORE,
-        'copper_ore': COPPER_ORE,
-        'gold_ore': GOLD_ORE,
-        'oak_leaves': OAK_LEAVES,
-        'pine_leaves': PINE_LEAVES,
-        'birch_leaves': BIRCH_LEAVES,
-        'water': WATER,
-        'lava': LAVA,
-        'dirt': DIRT,
-        'grass': GRASS,
-        'sand': SAND,
-        'crystal_clear': CRYSTAL_CLEAR,
-        'magical_energy': MAGICAL_ENERGY,
-        'dirt_brown': DIRT_BROWN,
-        'grass_green': GRASS_GREEN,
-        'sand_yellow': SAND_YELLOW,
-        'bedrock_dark': BEDROCK_DARK,
-        'topsoil_rich': TOPSOIL_RICH,
-        'subsoil_pale': SUBSOIL_PALE
-    }
-    return palettes.get(material_name, STONE_BASIC)
+    return _PALETTES_BY_NAME.get(material_name, STONE_BASIC)
 
 def blend_colors(color1: Color, color2: Color, ratio: float = 0.5) -> Color:
     """Blend two colors together. Ratio 0.0 = all color1, 1.0 = all color2."""
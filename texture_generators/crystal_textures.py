@@ -10,7 +10,7 @@ Designed for 25cm×25cm voxel scale for enhanced detail.
 from PIL import ImageDraw
 import random
 import math
-from texture_generators.base_patterns import draw_crystalline_pattern, draw_speckled_pattern
+from texture_generators.base_patterns import draw_crystalline_pattern, draw_speckled_pattern, draw_color_points
 from texture_generators.color_palettes import get_palette, vary_color
 
 def generate_crystal_clear(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
@@ -29,14 +29,16 @@ def generate_crystal_clear(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
     draw_crystalline_pattern(draw, x0, y0, size, palette, crystal_count=4)
     
     # Add internal refractions
+    points = {}
     for _ in range(size * size // 8):
         rx = random.randint(x0, x0 + size - 1)
         ry = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.4:
-            draw.point((rx, ry), fill=palette['shine'])
+            points[rx, ry] = palette['shine']
         elif random.random() < 0.7:
-            draw.point((rx, ry), fill=palette['refraction'])
+            points[rx, ry] = palette['refraction']
+    draw_color_points(draw, points)
 
 def generate_crystal_blue(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Blue crystal with deep sapphire-like coloring."""
@@ -54,14 +56,16 @@ def generate_crystal_blue(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
     draw_crystalline_pattern(draw, x0, y0, size, palette, crystal_count=3)
     
     # Add blue crystal variations
+    points = {}
     for _ in range(size * size // 10):
         bx = random.randint(x0, x0 + size - 1)
         by = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.3:
-            draw.point((bx, by), fill=palette['shine'])
+            points[bx, by] = palette['shine']
         elif random.random() < 0.6:
-            draw.point((bx, by), fill=palette['deep'])
+            points[bx, by] = palette['deep']
+    draw_color_points(draw, points)
 
 def generate_crystal_red(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Red crystal with ruby-like properties."""
@@ -79,14 +83,16 @@ def generate_crystal_red(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> N
     draw_crystalline_pattern(draw, x0, y0, size, palette, crystal_count=3)
     
     # Add red crystal fire
+    points = {}
     for _ in range(size * size // 8):
         rx = random.randint(x0, x0 + size - 1)
         ry = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.4:
-            draw.point((rx, ry), fill=palette['shine'])
+            points[rx, ry] = palette['shine']
         elif random.random() < 0.7:
-            draw.point((rx, ry), fill=palette['fire'])
+            points[rx, ry] = palette['fire']
+    draw_color_points(draw, points)
 
 def generate_crystal_green(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Green crystal with emerald-like brilliance."""
@@ -104,14 +110,16 @@ def generate_crystal_green(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
     draw_crystalline_pattern(draw, x0, y0, size, palette, crystal_count=4)
     
     # Add emerald-like variations
+    points = {}
     for _ in range(size * size // 9):
         gx = random.randint(x0, x0 + size - 1)
         gy = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.3:
-            draw.point((gx, gy), fill=palette['shine'])
+            points[gx, gy] = palette['shine']
         elif random.random() < 0.6:
-            draw.point((gx, gy), fill=palette['forest'])
+            points[gx, gy] = palette['forest']
+    draw_color_points(draw, points)
 
 def generate_enchanted_stone(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Enchanted stone with magical runes and glowing properties."""
@@ -130,6 +138,7 @@ def generate_enchanted_stone(draw: ImageDraw.Draw, x0: int, y0: int, size: int)
     
     # Add magical runes and energy
     rune_count = size // 8
+    points = {}
     for _ in range(rune_count):
         rx = random.randint(x0 + 1, x0 + size - 2)
         ry = random.randint(y0 + 1, y0 + size - 2)
@@ -140,18 +149,21 @@ def generate_enchanted_stone(draw: ImageDraw.Draw, x0: int, y0: int, size: int)
             # Horizontal rune line
             for i in range(rune_size):
                 if rx + i < x0 + size:
-                    draw.point((rx + i, ry), fill=palette['rune'])
+                    points[rx + i, ry] = palette['rune']
         else:
             # Vertical rune line
             for i in range(rune_size):
                 if ry + i < y0 + size:
-                    draw.point((rx, ry + i), fill=palette['rune'])
+                    points[rx, ry + i] = palette['rune']
+    draw_color_points(draw, points)
     
     # Add magical energy sparkles
+    points = {}
     for _ in range(size * size // 15):
         mx = random.randint(x0, x0 + size - 1)
         my = random.randint(y0, y0 + size - 1)
-        draw.point((mx, my), fill=palette['magic'])
+        points[mx, my] = palette['magic']
+    draw_color_points(draw, points)
 
 def generate_runic_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Stone block with carved runes and magical inscriptions."""
@@ -187,13 +199,17 @@ def generate_runic_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> N
             mid_x = px + pattern_size // 2
             mid_y = py + pattern_size // 2
             # Horizontal line
+            points = {}
             for i in range(pattern_size):
                 if px + i < x0 + size:
-                    draw.point((px + i, mid_y), fill=palette['carved'])
+                    points[px + i, mid_y] = palette['carved']
+            draw_color_points(draw, points)
             # Vertical line
+            points = {}
             for i in range(pattern_size):
                 if py + i < y0 + size:
-                    draw.point((mid_x, py + i), fill=palette['carved'])
+                    points[mid_x, py + i] = palette['carved']
+            draw_color_points(draw, points)
         else:
             # Circle rune
             center_x = px + pattern_size // 2
@@ -205,13 +221,15 @@ def generate_runic_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> N
             ], outline=palette['carved'])
     
     # Add magical glow to some runes
+    points = {}
     for _ in range(size // 10):
         gx = random.randint(x0, x0 + size - 1)
         gy = random.randint(y0, y0 + size - 1)
         if random.random() < 0.7:
-            draw.point((gx, gy), fill=palette['rune_glow'])
+            points[gx, gy] = palette['rune_glow']
         else:
-            draw.point((gx, gy), fill=palette['magic'])
+            points[gx, gy] = palette['magic']
+    draw_color_points(draw, points)
 
 def generate_ether_crystal(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Ethereal crystal with otherworldly properties."""
@@ -229,14 +247,16 @@ def generate_ether_crystal(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
     draw_crystalline_pattern(draw, x0, y0, size, palette, crystal_count=5)
     
     # Add ethereal glow effects
+    points = {}
     for _ in range(size * size // 6):
         ex = random.randint(x0, x0 + size - 1)
         ey = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.5:
-            draw.point((ex, ey), fill=palette['glow'])
+            points[ex, ey] = palette['glow']
         elif random.random() < 0.8:
-            draw.point((ex, ey), fill=palette['void'])
+            points[ex, ey] = palette['void']
+    draw_color_points(draw, points)
 
 def generate_void_stone(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Dark void stone that seems to absorb light."""
@@ -251,16 +271,18 @@ def generate_void_stone(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> No
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add void patterns
+    points = {}
     for _ in range(size * size // 5):
         vx = random.randint(x0, x0 + size - 1)
         vy = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.6:
-            draw.point((vx, vy), fill=palette['void'])
+            points[vx, vy] = palette['void']
         elif random.random() < 0.8:
-            draw.point((vx, vy), fill=palette['anti_glow'])
+            points[vx, vy] = palette['anti_glow']
         else:
-            draw.point((vx, vy), fill=palette['edge'])
+            points[vx, vy] = palette['edge']
+    draw_color_points(draw, points)
 
 def generate_celestial_marble(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Celestial marble with starlike inclusions."""
@@ -276,6 +298,7 @@ def generate_celestial_marble(draw: ImageDraw.Draw, x0: int, y0: int, size: int)
     
     # Add marble veining
     vein_count = size // 4
+    points = {}
     for _ in range(vein_count):
         # Random vein path
         start_x = random.randint(x0, x0 + size - 1)
@@ -287,23 +310,26 @@ def generate_celestial_marble(draw: ImageDraw.Draw, x0: int, y0: int, size: int)
             vy = start_y + i // 2 + random.randint(-1, 1)
             
             if x0 <= vx < x0 + size and y0 <= vy < y0 + size:
-                draw.point((vx, vy), fill=palette['vein'])
+                points[vx, vy] = palette['vein']
+    draw_color_points(draw, points)
     
     # Add celestial stars
     star_count = size // 6
+    points = {}
     for _ in range(star_count):
         sx = random.randint(x0, x0 + size - 1)
         sy = random.randint(y0, y0 + size - 1)
         
         # Star sparkle
-        draw.point((sx, sy), fill=palette['star'])
+        points[sx, sy] = palette['star']
         
         # Celestial glow around star
         for dx in [-1, 0, 1]:
             for dy in [-1, 0, 1]:
                 if x0 <= sx + dx < x0 + size and y0 <= sy + dy < y0 + size:
                     if random.random() < 0.3:
-                        draw.point((sx + dx, sy + dy), fill=palette['celestial'])
+                        points[sx + dx, sy + dy] = palette['celestial']
+    draw_color_points(draw, points)
 
 def generate_shadow_glass(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Dark, smoky glass with shadow-like properties."""
@@ -318,16 +344,18 @@ def generate_shadow_glass(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add smoky patterns
+    points = {}
     for _ in range(size * size // 7):
         gx = random.randint(x0, x0 + size - 1)
         gy = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.4:
-            draw.point((gx, gy), fill=palette['shadow'])
+            points[gx, gy] = palette['shadow']
         elif random.random() < 0.6:
-            draw.point((gx, gy), fill=palette['smoke'])
+            points[gx, gy] = palette['smoke']
         elif random.random() < 0.8:
-            draw.point((gx, gy), fill=palette['light'])
+            points[gx, gy] = palette['light']
+    draw_color_points(draw, points)
 
 def generate_fancy_diamond(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Fancy diamond with brilliant sparkles, refractions, and prismatic effects."""
@@ -425,10 +453,11 @@ def generate_fancy_diamond(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
         (x0 + 2*size//3, y0 + 2*size//3)
     ]
     
+    points = {}
     for sx, sy in sparkle_positions:
         if sx >= x0 and sy >= y0 and sx < x0 + size - 1 and sy < y0 + size - 1:
             # Central brilliant point
-            draw.point((sx, sy), fill=palette['sparkle'])
+            points[sx, sy] = palette['sparkle']
             
             # Create 8-pointed star sparkle pattern
             sparkle_reach = max(1, size // 16)
@@ -439,7 +468,7 @@ def generate_fancy_diamond(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
                     if x0 <= ray_x < x0 + size and y0 <= ray_y < y0 + size:
                         intensity = 255 - (reach * 40)  # Fade sparkle
                         ray_color = (255, 255, 255, max(100, intensity))
-                        draw.point((ray_x, ray_y), fill=ray_color)
+                        points[ray_x, ray_y] = ray_color
                 
                 # Diagonal rays for 8-point star
                 for dx, dy in [(reach, reach), (-reach, reach), (reach, -reach), (-reach, -reach)]:
@@ -447,7 +476,8 @@ def generate_fancy_diamond(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
                     if x0 <= ray_x < x0 + size and y0 <= ray_y < y0 + size:
                         intensity = 255 - (reach * 60)  # Fade diagonal rays more
                         ray_color = (255, 255, 255, max(80, intensity))
-                        draw.point((ray_x, ray_y), fill=ray_color)
+                        points[ray_x, ray_y] = ray_color
+    draw_color_points(draw, points)
     
     # Enhanced sharp crystal edges with multiple layers
     edge_thickness = max(1, size // 14)
@@ -471,9 +501,11 @@ def generate_fancy_diamond(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
         (x0 + size//2, y0 + size//2)
     ]
     
+    points = {}
     for fx, fy in fire_positions:
         if fx >= x0 and fy >= y0 and fx < x0 + size - 1 and fy < y0 + size - 1:
-            draw.point((fx, fy), fill=palette['fire'])
+            points[fx, fy] = palette['fire']
+    draw_color_points(draw, points)
 
 # Lookup table for crystal generators
 CRYSTAL_GENERATORS = {
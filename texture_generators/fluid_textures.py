@@ -9,7 +9,7 @@ Designed for 25cm×25cm voxel scale for enhanced detail.
 
 from PIL import ImageDraw
 import random
-from texture_generators.base_patterns import draw_fluid_pattern, draw_speckled_pattern
+from texture_generators.base_patterns import draw_fluid_pattern, draw_speckled_pattern, draw_color_points
 from texture_generators.color_palettes import get_palette, vary_color
 
 def generate_water(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
@@ -101,21 +101,23 @@ def generate_oil(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     draw_fluid_pattern(draw, x0, y0, size, palette, wave_count=2)
     
     # Add iridescent surface effects
+    points = {}
     for _ in range(size * size // 10):
         ox = random.randint(x0, x0 + size - 1)
         oy = random.randint(y0, y0 + size - 1)
         
         # Iridescent spots
         if random.random() < 0.3:
-            draw.point((ox, oy), fill=palette['iridescent'])
+            points[ox, oy] = palette['iridescent']
         
         # Purple reflections
         elif random.random() < 0.5:
-            draw.point((ox, oy), fill=palette['reflection'])
+            points[ox, oy] = palette['reflection']
         
         # Deep dark spots
         else:
-            draw.point((ox, oy), fill=palette['dark'])
+            points[ox, oy] = palette['dark']
+    draw_color_points(draw, points)
 
 def generate_acid(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Corrosive acid with bubbling and toxic green color."""
@@ -167,21 +169,23 @@ def generate_honey(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     draw_fluid_pattern(draw, x0, y0, size, palette, wave_count=2)
     
     # Add amber-like variations
+    points = {}
     for _ in range(size * size // 8):
         hx = random.randint(x0, x0 + size - 1)
         hy = random.randint(y0, y0 + size - 1)
         
         # Light spots
         if random.random() < 0.5:
-            draw.point((hx, hy), fill=palette['light'])
+            points[hx, hy] = palette['light']
         
         # Dark spots
         elif random.random() < 0.7:
-            draw.point((hx, hy), fill=palette['dark'])
+            points[hx, hy] = palette['dark']
         
         # Amber highlights
         else:
-            draw.point((hx, hy), fill=palette['amber'])
+            points[hx, hy] = palette['amber']
+    draw_color_points(draw, points)
 
 # Gas textures
 def generate_steam(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
@@ -196,15 +200,17 @@ def generate_steam(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add wispy patterns
+    points = {}
     for _ in range(size * size // 3):
         sx = random.randint(x0, x0 + size - 1)
         sy = random.randint(y0, y0 + size - 1)
         
         # Random steam density
         if random.random() < 0.3:
-            draw.point((sx, sy), fill=palette['dense'])
+            points[sx, sy] = palette['dense']
         elif random.random() < 0.6:
-            draw.point((sx, sy), fill=palette['wisp'])
+            points[sx, sy] = palette['wisp']
+    draw_color_points(draw, points)
 
 def generate_toxic_gas(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Toxic gas with sickly green color and swirling patterns."""
@@ -218,15 +224,17 @@ def generate_toxic_gas(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> Non
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add swirling toxic patterns
+    points = {}
     for _ in range(size * size // 4):
         tx = random.randint(x0, x0 + size - 1)
         ty = random.randint(y0, y0 + size - 1)
         
         # Varying density
         if random.random() < 0.4:
-            draw.point((tx, ty), fill=palette['dense'])
+            points[tx, ty] = palette['dense']
         elif random.random() < 0.7:
-            draw.point((tx, ty), fill=palette['light'])
+            points[tx, ty] = palette['light']
+    draw_color_points(draw, points)
 
 # Lookup table for fluid generators
 FLUID_GENERATORS = {
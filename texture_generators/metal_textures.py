@@ -9,7 +9,7 @@ Designed for 25cm×25cm voxel scale for enhanced detail.
 
 from PIL import ImageDraw
 import random
-from texture_generators.base_patterns import draw_speckled_pattern
+from texture_generators.base_patterns import draw_speckled_pattern, draw_color_points
 from texture_generators.color_palettes import get_palette, vary_color
 
 def generate_iron_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
@@ -28,6 +28,7 @@ def generate_iron_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> No
     texture_count = size * size // 8
     
     # Create fixed pattern for surface variations
+    points = {}
     for i in range(texture_count):
         # Deterministic positions using grid pattern with offset
         grid_x = i % (size // 2)
@@ -42,12 +43,14 @@ def generate_iron_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> No
         # Surface variations based on position
         variation_type = (i + mx + my) % 10
         if variation_type < 3:
-            draw.point((mx, my), fill=palette['light'])
+            points[mx, my] = palette['light']
         elif variation_type < 5:
-            draw.point((mx, my), fill=palette['dark'])
+            points[mx, my] = palette['dark']
+    draw_color_points(draw, points)
     
     # Add subtle shine lines (metallic reflections) - deterministic
     shine_count = size // 4
+    points = {}
     for i in range(shine_count):
         # Fixed shine line positions
         if i < shine_count // 2:
@@ -62,7 +65,7 @@ def generate_iron_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> No
             for j in range(line_length):
                 px = max(x0, min(x0 + size - 1, sx + j))
                 if x0 <= px < x0 + size and y0 <= sy < y0 + size:
-                    draw.point((px, sy), fill=palette['shine'])
+                    points[px, sy] = palette['shine']
         else:
             # Vertical lines
             idx = i - shine_count // 2
@@ -76,7 +79,8 @@ def generate_iron_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> No
             for j in range(line_length):
                 py = max(y0, min(y0 + size - 1, sy + j))
                 if x0 <= sx < x0 + size and y0 <= py < y0 + size:
-                    draw.point((sx, py), fill=palette['shine'])
+                    points[sx, py] = palette['shine']
+    draw_color_points(draw, points)
 
 def generate_copper_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Copper block with reddish-brown metallic surface."""
@@ -91,14 +95,16 @@ def generate_copper_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add metallic surface texture
+    points = {}
     for _ in range(size * size // 6):
         cx = random.randint(x0, x0 + size - 1)
         cy = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.4:
-            draw.point((cx, cy), fill=palette['light'])
+            points[cx, cy] = palette['light']
         elif random.random() < 0.6:
-            draw.point((cx, cy), fill=palette['dark'])
+            points[cx, cy] = palette['dark']
+    draw_color_points(draw, points)
     
     # Add occasional patina spots (oxidation)
     for _ in range(size // 6):
@@ -124,16 +130,18 @@ def generate_bronze_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add metallic surface texture
+    points = {}
     for _ in range(size * size // 7):
         bx = random.randint(x0, x0 + size - 1)
         by = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.3:
-            draw.point((bx, by), fill=palette['light'])
+            points[bx, by] = palette['light']
         elif random.random() < 0.5:
-            draw.point((bx, by), fill=palette['dark'])
+            points[bx, by] = palette['dark']
         elif random.random() < 0.7:
-            draw.point((bx, by), fill=palette['shine'])
+            points[bx, by] = palette['shine']
+    draw_color_points(draw, points)
 
 def generate_steel_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Steel block with clean, polished metallic surface."""
@@ -148,16 +156,19 @@ def generate_steel_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> N
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add polished surface texture
+    points = {}
     for _ in range(size * size // 10):
         sx = random.randint(x0, x0 + size - 1)
         sy = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.2:
-            draw.point((sx, sy), fill=palette['light'])
+            points[sx, sy] = palette['light']
         elif random.random() < 0.3:
-            draw.point((sx, sy), fill=palette['dark'])
+            points[sx, sy] = palette['dark']
+    draw_color_points(draw, points)
     
     # Add mirror-like reflection lines
+    points = {}
     for _ in range(size // 6):
         # Random reflection line
         rx = random.randint(x0, x0 + size - 1)
@@ -169,7 +180,8 @@ def generate_steel_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> N
             px = max(x0, min(x0 + size - 1, rx + i))
             py = max(y0, min(y0 + size - 1, ry + i))
             if x0 <= px < x0 + size and y0 <= py < y0 + size:
-                draw.point((px, py), fill=palette['mirror'])
+                points[px, py] = palette['mirror']
+    draw_color_points(draw, points)
 
 def generate_silver_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Silver block with bright, reflective metallic surface."""
@@ -184,16 +196,18 @@ def generate_silver_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add highly reflective surface
+    points = {}
     for _ in range(size * size // 6):
         sx = random.randint(x0, x0 + size - 1)
         sy = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.4:
-            draw.point((sx, sy), fill=palette['light'])
+            points[sx, sy] = palette['light']
         elif random.random() < 0.6:
-            draw.point((sx, sy), fill=palette['dark'])
+            points[sx, sy] = palette['dark']
         elif random.random() < 0.8:
-            draw.point((sx, sy), fill=palette['shine'])
+            points[sx, sy] = palette['shine']
+    draw_color_points(draw, points)
 
 def generate_gold_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Gold block with rich, warm metallic surface."""
@@ -208,16 +222,18 @@ def generate_gold_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> No
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add rich metallic surface
+    points = {}
     for _ in range(size * size // 5):
         gx = random.randint(x0, x0 + size - 1)
         gy = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.3:
-            draw.point((gx, gy), fill=palette['light'])
+            points[gx, gy] = palette['light']
         elif random.random() < 0.5:
-            draw.point((gx, gy), fill=palette['dark'])
+            points[gx, gy] = palette['dark']
         elif random.random() < 0.7:
-            draw.point((gx, gy), fill=palette['shine'])
+            points[gx, gy] = palette['shine']
+    draw_color_points(draw, points)
 
 def generate_brass_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Brass block (copper + zinc alloy) with yellowish metallic surface."""
@@ -232,16 +248,18 @@ def generate_brass_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> N
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add metallic surface texture
+    points = {}
     for _ in range(size * size // 7):
         bx = random.randint(x0, x0 + size - 1)
         by = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.3:
-            draw.point((bx, by), fill=palette['light'])
+            points[bx, by] = palette['light']
         elif random.random() < 0.5:
-            draw.point((bx, by), fill=palette['dark'])
+            points[bx, by] = palette['dark']
         elif random.random() < 0.7:
-            draw.point((bx, by), fill=palette['tarnish'])
+            points[bx, by] = palette['tarnish']
+    draw_color_points(draw, points)
 
 def generate_pewter_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Generate pewter block texture (dull grey metal)"""
@@ -258,14 +276,16 @@ def generate_pewter_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add dull metallic texture
+    points = {}
     for _ in range(size * size // 8):
         px = random.randint(x0, x0 + size - 1)
         py = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.4:
-            draw.point((px, py), fill=palette['light'])
+            points[px, py] = palette['light']
         elif random.random() < 0.6:
-            draw.point((px, py), fill=palette['dark'])
+            points[px, py] = palette['dark']
+    draw_color_points(draw, points)
 
 def generate_mithril_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Mithril block with silvery-blue magical metallic surface."""
@@ -280,16 +300,18 @@ def generate_mithril_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add magical metallic properties
+    points = {}
     for _ in range(size * size // 5):
         mx = random.randint(x0, x0 + size - 1)
         my = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.4:
-            draw.point((mx, my), fill=palette['light'])
+            points[mx, my] = palette['light']
         elif random.random() < 0.6:
-            draw.point((mx, my), fill=palette['dark'])
+            points[mx, my] = palette['dark']
         elif random.random() < 0.8:
-            draw.point((mx, my), fill=palette['magic'])
+            points[mx, my] = palette['magic']
+    draw_color_points(draw, points)
 
 def generate_adamantine_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Adamantine block with incredibly hard, dark metallic surface."""
@@ -304,16 +326,18 @@ def generate_adamantine_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int)
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add incredibly hard surface texture
+    points = {}
     for _ in range(size * size // 8):
         ax = random.randint(x0, x0 + size - 1)
         ay = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.2:
-            draw.point((ax, ay), fill=palette['light'])
+            points[ax, ay] = palette['light']
         elif random.random() < 0.4:
-            draw.point((ax, ay), fill=palette['dark'])
+            points[ax, ay] = palette['dark']
         elif random.random() < 0.6:
-            draw.point((ax, ay), fill=palette['edge'])
+            points[ax, ay] = palette['edge']
+    draw_color_points(draw, points)
 
 # Lookup table for metal generators
 METAL_GENERATORS = {
@@ -0,0 +1,77 @@
+"""
+Noise Fields
+============
+
+Vectorized gradient (Perlin) noise for natural-looking texture variation.
+Fields wrap at their edges, so textures built from them tile seamlessly.
+"""
+
+import numpy as np
+from typing import Tuple
+
+def _fade(t: np.ndarray) -> np.ndarray:
+    """Perlin's quintic fade curve 6t^5 - 15t^4 + 10t^3."""
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+def _gradient_octave(height: int, width: int, channels: int, cells: int,
+                     rng: np.random.Generator) -> np.ndarray:
+    """One octave of wrapping gradient noise, shape (channels, height, width), roughly in [-1, 1]."""
+    # Unit gradients on a cells x cells lattice; index cells wraps to 0
+    angles = rng.uniform(0.0, 2.0 * np.pi, (channels, cells, cells))
+    grad_x, grad_y = np.cos(angles), np.sin(angles)
+
+    # Sample at pixel centres in lattice units
+    ys = (np.arange(height) + 0.5) * (cells / height)
+    xs = (np.arange(width) + 0.5) * (cells / width)
+    y0, x0 = ys.astype(np.intp), xs.astype(np.intp)
+    fy, fx = ys - y0, xs - x0
+    y1, x1 = (y0 + 1) % cells, (x0 + 1) % cells
+
+    def corner(yi, xi, dy, dx):
+        # Dot product of the corner gradient with the offset to the sample
+        return (grad_x[:, yi[:, None], xi[None, :]] * dx[None, :]
+                + grad_y[:, yi[:, None], xi[None, :]] * dy[:, None])
+
+    n00 = corner(y0, x0, fy, fx)
+    n01 = corner(y0, x1, fy, fx - 1)
+    n10 = corner(y1, x0, fy - 1, fx)
+    n11 = corner(y1, x1, fy - 1, fx - 1)
+
+    u = _fade(fx)[None, :]
+    v = _fade(fy)[:, None]
+    top = n00 + u * (n01 - n00)
+    bottom = n10 + u * (n11 - n10)
+    # 2D gradient noise peaks at sqrt(1/2); scale it out to about [-1, 1]
+    return (top + v * (bottom - top)) * np.sqrt(2.0)
+
+def perlin2d(shape: Tuple[int, ...], octaves: int = 3, seed=None,
+             base_cells: int = 2, persistence: float = 0.5) -> np.ndarray:
+    """
+    Sum-of-octaves Perlin noise (turbulence) over a 2D grid.
+
+    Args:
+        shape: (height, width) for one field, or (height, width, channels)
+               for independent fields stacked along the last axis
+        octaves: Number of octaves; each doubles the lattice frequency
+        seed: Anything np.random.default_rng accepts, including a Generator
+        base_cells: Lattice cells across the first octave
+        persistence: Amplitude factor from one octave to the next
+
+    Returns:
+        float32 array of the given shape with values roughly in [-1, 1]
+    """
+    rng = np.random.default_rng(seed)
+    height, width = shape[:2]
+    channels = shape[2] if len(shape) > 2 else 1
+
+    total = np.zeros((channels, height, width), dtype=np.float64)
+    amplitude = 1.0
+    weight = 0.0
+    for octave in range(octaves):
+        total += amplitude * _gradient_octave(height, width, channels, base_cells << octave, rng)
+        weight += amplitude
+        amplitude *= persistence
+    total /= weight
+
+    field = np.moveaxis(total, 0, -1) if len(shape) > 2 else total[0]
+    return np.ascontiguousarray(field, dtype=np.float32)
@@ -8,7 +8,7 @@ Generators for ore blocks using stone base with mineral overlays.
 from PIL import ImageDraw
 import random
 import math
-from texture_generators.base_patterns import draw_speckled_pattern, draw_crystalline_pattern, draw_vein_pattern
+from texture_generators.base_patterns import draw_speckled_pattern, draw_crystalline_pattern, draw_vein_pattern, draw_color_points
 from texture_generators.color_palettes import get_palette
 from texture_generators.base_patterns import draw_speckled_pattern, draw_crystalline_pattern, draw_vein_pattern
 from texture_generators.color_palettes import get_palette
@@ -73,6 +73,7 @@ def generate_iron_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None
         {'start': (x0 + size // 3, y0 + size // 6), 'end': (x0 + 2 * size // 3, y0 + 5 * size // 6), 'width': 1}
     ]
     
+    points = {}
     for vein_idx in range(min(vein_count, len(vein_configs))):
         config = vein_configs[vein_idx]
         start_x, start_y = config['start']
@@ -107,7 +108,7 @@ def generate_iron_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None
                 
                 # Iron color alternates deterministically
                 iron_color = iron_palette['iron'] if (i + w) % 3 == 0 else iron_palette['iron_rust']
-                draw.point((wx, wy), fill=iron_color)
+                points[wx, wy] = iron_color
                 
                 # Add clusters at specific intervals
                 if i % 4 == 0:
@@ -116,7 +117,8 @@ def generate_iron_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None
                             px = max(x0, min(x0 + size - 1, wx + dx))
                             py = max(y0, min(y0 + size - 1, wy + dy))
                             if (dx + dy) % 2 == 0:  # Checkered pattern
-                                draw.point((px, py), fill=iron_color)
+                                points[px, py] = iron_color
+    draw_color_points(draw, points)
 
 def generate_copper_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Copper ore with green oxidation and copper veins."""
@@ -142,12 +144,13 @@ def generate_copper_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> No
         (x0 + 5 * size // 6, y0 + size // 2)
     ]
     
+    points = {}
     for i in range(min(oxidation_count, len(oxidation_positions))):
         ox, oy = oxidation_positions[i]
         ox = max(x0, min(x0 + size - 1, ox))
         oy = max(y0, min(y0 + size - 1, oy))
         
-        draw.point((ox, oy), fill=copper_palette['copper_oxide'])
+        points[ox, oy] = copper_palette['copper_oxide']
         
         # Add oxidation cluster for first and third spots
         if i % 2 == 0:
@@ -156,7 +159,8 @@ def generate_copper_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> No
                     if (dx + dy) % 2 == 0:  # Checkered pattern
                         px = max(x0, min(x0 + size - 1, ox + dx))
                         py = max(y0, min(y0 + size - 1, oy + dy))
-                        draw.point((px, py), fill=copper_palette['copper_oxide'])
+                        points[px, py] = copper_palette['copper_oxide']
+    draw_color_points(draw, points)
 
 def generate_gold_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Gold ore with bright gold veins and flakes in stone."""
@@ -176,6 +180,7 @@ def generate_gold_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None
         {'start': (x0 + size // 4, y0), 'end': (x0 + 3 * size // 4, y0 + size - 1)}
     ]
     
+    points = {}
     for vein_idx in range(min(vein_count, len(vein_configs))):
         config = vein_configs[vein_idx]
         start_x, start_y = config['start']
@@ -210,7 +215,7 @@ def generate_gold_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None
                 
                 # Gold color alternates deterministically
                 gold_color = gold_palette['gold'] if (i + w + vein_idx) % 2 == 0 else gold_palette['gold_bright']
-                draw.point((wx, wy), fill=gold_color)
+                points[wx, wy] = gold_color
                 
                 # Add clusters at specific intervals
                 if i % 3 == 0:
@@ -219,7 +224,8 @@ def generate_gold_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None
                             px = max(x0, min(x0 + size - 1, wx + dx))
                             py = max(y0, min(y0 + size - 1, wy + dy))
                             if (dx * dy) == 0:  # Cross pattern
-                                draw.point((px, py), fill=gold_color)
+                                points[px, py] = gold_color
+    draw_color_points(draw, points)
     
     # Add additional gold flakes for sparkle - deterministic positions
     flake_count = size // 4
@@ -231,13 +237,15 @@ def generate_gold_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None
         (x0 + size // 8, y0 + 3 * size // 4)
     ]
     
+    points = {}
     for i in range(min(flake_count, len(flake_positions))):
         gx, gy = flake_positions[i]
         gx = max(x0, min(x0 + size - 1, gx))
         gy = max(y0, min(y0 + size - 1, gy))
         
         gold_color = gold_palette['gold'] if i % 2 == 0 else gold_palette['gold_bright']
-        draw.point((gx, gy), fill=gold_color)
+        points[gx, gy] = gold_color
+    draw_color_points(draw, points)
 
 def generate_silver_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Silver ore with metallic silver veins and deposits."""
@@ -267,6 +275,7 @@ def generate_silver_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> No
         {'start': (x0 + size // 4, y0), 'end': (x0 + 3 * size // 4, y0 + size - 1)}
     ]
     
+    points = {}
     for vein_idx in range(min(vein_count, len(vein_configs))):
         config = vein_configs[vein_idx]
         start_x, start_y = config['start']
@@ -296,7 +305,7 @@ def generate_silver_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> No
             # Draw vein segment with alternating silver colors
             color_index = (i + vein_idx) % 2
             silver_color = silver_palette['base'] if color_index == 0 else silver_palette['bright']
-            draw.point((vx, vy), fill=silver_color)
+            points[vx, vy] = silver_color
             
             # Add clusters at specific intervals
             if i % 4 == 0:
@@ -312,7 +321,8 @@ def generate_silver_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> No
                                 cluster_color = silver_palette['bright']
                             else:
                                 cluster_color = silver_palette['dark']
-                            draw.point((px, py), fill=cluster_color)
+                            points[px, py] = cluster_color
+    draw_color_points(draw, points)
     
     # Add additional silver deposits - deterministic positions
     deposit_count = size // 5
@@ -324,13 +334,15 @@ def generate_silver_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> No
         (x0 + 4 * size // 5, y0 + size // 2)
     ]
     
+    points = {}
     for i in range(min(deposit_count, len(deposit_positions))):
         sx, sy = deposit_positions[i]
         sx = max(x0, min(x0 + size - 1, sx))
         sy = max(y0, min(y0 + size - 1, sy))
         
         silver_color = silver_palette['base'] if i % 2 == 0 else silver_palette['bright']
-        draw.point((sx, sy), fill=silver_color)
+        points[sx, sy] = silver_color
+    draw_color_points(draw, points)
 
 def generate_tin_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Tin ore with dull metallic veins and deposits."""
@@ -355,6 +367,7 @@ def generate_tin_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
         {'start': (x0 + size // 3, y0), 'angle': 1.5708}   # 90 degrees
     ]
     
+    points = {}
     for vein_idx in range(min(vein_count, len(vein_configs))):
         config = vein_configs[vein_idx]
         start_x, start_y = config['start']
@@ -386,7 +399,7 @@ def generate_tin_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
                     tin_color = tin_palette['dull']
                 else:
                     tin_color = tin_palette['light']
-                draw.point((vx, vy), fill=tin_color)
+                points[vx, vy] = tin_color
                 
                 # Add crystal formations at specific intervals
                 if i % 5 == 0:
@@ -404,7 +417,8 @@ def generate_tin_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
                                     crystal_color = tin_palette['base']
                                 else:
                                     crystal_color = tin_palette['dull']
-                                draw.point((px, py), fill=crystal_color)
+                                points[px, py] = crystal_color
+    draw_color_points(draw, points)
     
     # Add some scattered tin deposits - deterministic positions
     deposit_count = size // 6
@@ -416,13 +430,15 @@ def generate_tin_ore(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
         (x0 + 3 * size // 4, y0 + size // 8)
     ]
     
+    points = {}
     for i in range(min(deposit_count, len(deposit_positions))):
         tx, ty = deposit_positions[i]
         tx = max(x0, min(x0 + size - 1, tx))
         ty = max(y0, min(y0 + size - 1, ty))
         
         tin_color = tin_palette['base'] if i % 2 == 0 else tin_palette['dull']
-        draw.point((tx, ty), fill=tin_color)
+        points[tx, ty] = tin_color
+    draw_color_points(draw, points)
 
 def generate_ruby_gem(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Ruby with crystalline red structure and distinct appearance."""
@@ -550,12 +566,14 @@ def generate_sapphire_gem(draw: ImageDraw.Draw, x0: int, y0: int, size: int) ->
             # Add internal structure lines for depth and clarity - deterministic
             if width > 3 and height > 3:
                 # Horizontal lines at fixed intervals
+                line_points = {}
                 for j in range(1, 3):
                     y_pos = cy - height//2 + j*height//3
                     for x_pos in range(cx - width//2, cx + width//2):
                         if x0 <= x_pos < x0 + size and y0 <= y_pos < y0 + size:
                             if (x_pos + j) % 2 == 0:  # Deterministic pattern
-                                draw.point((x_pos, y_pos), fill=sapphire_palette['edge'])
+                                line_points[x_pos, y_pos] = sapphire_palette['edge']
+                draw_color_points(draw, line_points)
             
             # Add bright highlight - fixed position
             highlight_x = cx + width//4 if i % 2 == 0 else cx - width//4
@@ -8,7 +8,7 @@ Each organic type has unique patterns and characteristics.
 
 from PIL import ImageDraw
 import random
-from texture_generators.base_patterns import draw_mottled_pattern, draw_speckled_pattern
+from texture_generators.base_patterns import draw_mottled_pattern, draw_speckled_pattern, draw_color_points
 from texture_generators.color_palettes import get_palette
 
 def generate_oak_leaves(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str = 'all') -> None:
@@ -18,6 +18,7 @@ def generate_oak_leaves(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face:
     
     # Add leaf veins
     vein_color = palette.get('vein', (70, 110, 35, 255))
+    points = {}
     for _ in range(size // 4):
         # Random vein starting point
         vx = random.randint(x0, x0 + size - 1)
@@ -39,7 +40,8 @@ def generate_oak_leaves(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face:
                 py = max(y0, min(y0 + size - 1, vy + i))
             
             if x0 <= px < x0 + size and y0 <= py < y0 + size:
-                draw.point((px, py), fill=vein_color)
+                points[px, py] = vein_color
+    draw_color_points(draw, points)
 
 def generate_pine_leaves(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Pine needles with fine, textured appearance."""
@@ -53,19 +55,21 @@ def generate_pine_leaves(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> N
     highlight_color = palette.get('highlight', (60, 100, 60, 255))
     
     # Many small needle marks
+    points = {}
     for _ in range(size * size // 3):
         nx = random.randint(x0, x0 + size - 1)
         ny = random.randint(y0, y0 + size - 1)
         
         needle_type = random.choice([needle_color, highlight_color, palette['shadow']])
-        draw.point((nx, ny), fill=needle_type)
+        points[nx, ny] = needle_type
         
         # Sometimes draw small needle clusters
         if random.random() < 0.2:
             for dx in [-1, 0, 1]:
                 px = max(x0, min(x0 + size - 1, nx + dx))
                 if x0 <= px < x0 + size:
-                    draw.point((px, ny), fill=needle_type)
+                    points[px, ny] = needle_type
+    draw_color_points(draw, points)
 
 def generate_birch_leaves(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str = 'all') -> None:
     """Birch leaves with light, delicate appearance."""
@@ -74,10 +78,12 @@ def generate_birch_leaves(draw: ImageDraw.Draw, x0: int, y0: int, size: int, fac
     
     # Add light spots (characteristic of birch)
     light_color = (220, 255, 220, 255)
+    points = {}
     for _ in range(size // 3):
         lx = random.randint(x0, x0 + size - 1)
         ly = random.randint(y0, y0 + size - 1)
-        draw.point((lx, ly), fill=light_color)
+        points[lx, ly] = light_color
+    draw_color_points(draw, points)
 
 def generate_palm_leaves(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Palm fronds with long, flowing patterns."""
@@ -93,6 +99,7 @@ def generate_palm_leaves(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> N
     
     # Draw palm frond lines
     frond_color = palette['frond']
+    points = {}
     for i in range(size // 2):
         # Diagonal frond lines
         start_x = x0 + random.randint(0, size // 2)
@@ -104,7 +111,8 @@ def generate_palm_leaves(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> N
             fy = start_y + j
             
             if x0 <= fx < x0 + size and y0 <= fy < y0 + size:
-                draw.point((fx, fy), fill=frond_color)
+                points[fx, fy] = frond_color
+    draw_color_points(draw, points)
 
 def generate_brown_mushroom(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str = 'all') -> None:
     """Brown mushroom with cap pattern."""
@@ -114,6 +122,7 @@ def generate_brown_mushroom(draw: ImageDraw.Draw, x0: int, y0: int, size: int, f
     
     # Add mushroom spots
     spot_color = (160, 82, 45, 255)  # Lighter brown
+    points = {}
     for _ in range(size // 4):
         sx = random.randint(x0, x0 + size - 1)
         sy = random.randint(y0, y0 + size - 1)
@@ -124,7 +133,8 @@ def generate_brown_mushroom(draw: ImageDraw.Draw, x0: int, y0: int, size: int, f
             for dy in range(-spot_size, spot_size + 1):
                 if dx*dx + dy*dy <= spot_size*spot_size:
                     if x0 <= sx + dx < x0 + size and y0 <= sy + dy < y0 + size:
-                        draw.point((sx + dx, sy + dy), fill=spot_color)
+                        points[sx + dx, sy + dy] = spot_color
+    draw_color_points(draw, points)
 
 def generate_red_mushroom(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str = 'all') -> None:
     """Red mushroom with white spots."""
@@ -134,6 +144,7 @@ def generate_red_mushroom(draw: ImageDraw.Draw, x0: int, y0: int, size: int, fac
     
     # Add white spots
     spot_color = (255, 255, 255, 255)  # White
+    points = {}
     for _ in range(size // 3):
         sx = random.randint(x0, x0 + size - 1)
         sy = random.randint(y0, y0 + size - 1)
@@ -144,7 +155,8 @@ def generate_red_mushroom(draw: ImageDraw.Draw, x0: int, y0: int, size: int, fac
             for dy in range(-spot_size, spot_size + 1):
                 if dx*dx + dy*dy <= spot_size*spot_size:
                     if x0 <= sx + dx < x0 + size and y0 <= sy + dy < y0 + size:
-                        draw.point((sx + dx, sy + dy), fill=spot_color)
+                        points[sx + dx, sy + dy] = spot_color
+    draw_color_points(draw, points)
 
 def generate_cactus(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str = 'all') -> None:
     """Cactus with spines and desert coloring."""
@@ -154,17 +166,21 @@ def generate_cactus(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str
     
     # Add cactus spines
     spine_color = (255, 255, 255, 255)  # White spines
+    points = {}
     for _ in range(size // 2):
         sx = random.randint(x0, x0 + size - 1)
         sy = random.randint(y0, y0 + size - 1)
-        draw.point((sx, sy), fill=spine_color)
+        points[sx, sy] = spine_color
+    draw_color_points(draw, points)
     
     # Add vertical ridges
     ridge_color = (0, 100, 0, 255)  # Darker green
+    points = {}
     for x in range(x0 + size // 4, x0 + size, size // 4):
         for y in range(y0, y0 + size):
             if random.random() < 0.6:  # 60% coverage
-                draw.point((x, y), fill=ridge_color)
+                points[x, y] = ridge_color
+    draw_color_points(draw, points)
 
 def generate_jungle_vine(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str) -> None:
     """Jungle vines with hanging texture patterns."""
@@ -175,11 +191,13 @@ def generate_jungle_vine(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face
     vine_color = (20, 100, 20, 255)
     for i in range(3, size, 6):  # Every 6 pixels, starting from 3
         x = x0 + i
+        points = {}
         for y in range(y0, y0 + size):
             if random.random() < 0.8:  # 80% chance for each pixel
                 offset = random.randint(-1, 1)
                 vine_x = max(x0, min(x0 + size - 1, x + offset))
-                draw.point((vine_x, y), fill=vine_color)
+                points[vine_x, y] = vine_color
+        draw_color_points(draw, points)
 
 def generate_pink_coral(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str) -> None:
     """Pink coral with branching patterns."""
@@ -188,6 +206,7 @@ def generate_pink_coral(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face:
     
     # Add coral branch patterns
     branch_color = (255, 20, 147, 255)  # Deep pink
+    points = {}
     for _ in range(size // 3):
         # Random branch starting point
         bx = random.randint(x0, x0 + size - 1)
@@ -199,7 +218,8 @@ def generate_pink_coral(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face:
                 new_x = bx + angle[0] * length
                 new_y = by + angle[1] * length
                 if x0 <= new_x < x0 + size and y0 <= new_y < y0 + size:
-                    draw.point((new_x, new_y), fill=branch_color)
+                    points[new_x, new_y] = branch_color
+    draw_color_points(draw, points)
 
 def generate_blue_coral(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str) -> None:
     """Blue coral with branching patterns."""
@@ -208,6 +228,7 @@ def generate_blue_coral(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face:
     
     # Add coral branch patterns
     branch_color = (0, 191, 255, 255)  # Deep sky blue
+    points = {}
     for _ in range(size // 3):
         # Random branch starting point
         bx = random.randint(x0, x0 + size - 1)
@@ -219,7 +240,8 @@ def generate_blue_coral(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face:
                 new_x = bx + angle[0] * length
                 new_y = by + angle[1] * length
                 if x0 <= new_x < x0 + size and y0 <= new_y < y0 + size:
-                    draw.point((new_x, new_y), fill=branch_color)
+                    points[new_x, new_y] = branch_color
+    draw_color_points(draw, points)
 
 def generate_seaweed(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str) -> None:
     """Seaweed with flowing patterns."""
@@ -230,13 +252,15 @@ def generate_seaweed(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: st
     strand_color = (76, 175, 80, 255)  # Lighter green
     for i in range(2, size, 8):  # Every 8 pixels
         x = x0 + i
+        points = {}
         for y in range(y0, y0 + size):
             # Create wavy pattern
             wave = int(2 * ((y - y0) / size * 3.14159 * 2))
             wave_offset = wave % 3 - 1
             strand_x = max(x0, min(x0 + size - 1, x + wave_offset))
             if random.random() < 0.7:  # 70% density
-                draw.point((strand_x, y), fill=strand_color)
+                points[strand_x, y] = strand_color
+        draw_color_points(draw, points)
 
 def generate_tundra_moss(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str) -> None:
     """Tundra moss with sparse, low-growing pattern."""
@@ -257,10 +281,12 @@ def generate_tundra_moss(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face
         
         # Small moss patch (1-3 pixels)
         patch_size = random.randint(1, 3)
+        points = {}
         for dx in range(patch_size):
             for dy in range(patch_size):
                 if mx + dx < x0 + size and my + dy < y0 + size:
-                    draw.point((mx + dx, my + dy), fill=moss_color)
+                    points[mx + dx, my + dy] = moss_color
+        draw_color_points(draw, points)
 
 # Update existing methods to include face parameter
 def generate_oak_leaves(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str = 'all') -> None:
@@ -270,6 +296,7 @@ def generate_oak_leaves(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face:
     
     # Add leaf veins
     vein_color = palette.get('vein', (70, 110, 35, 255))
+    points = {}
     for _ in range(size // 4):
         # Random vein starting point
         vx = random.randint(x0, x0 + size - 1)
@@ -291,7 +318,8 @@ def generate_oak_leaves(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face:
                 py = max(y0, min(y0 + size - 1, vy + i))
             
             if x0 <= px < x0 + size and y0 <= py < y0 + size:
-                draw.point((px, py), fill=vein_color)
+                points[px, py] = vein_color
+    draw_color_points(draw, points)
 
 def generate_pine_needles(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str = 'all') -> None:
     """Pine needles with fine, textured appearance."""
@@ -310,11 +338,13 @@ def generate_pine_needles(draw: ImageDraw.Draw, x0: int, y0: int, size: int, fac
         needle_length = random.randint(1, 3)
         direction = random.choice([(1, 0), (0, 1), (1, 1), (-1, 1)])
         
+        points = {}
         for i in range(needle_length):
             px = nx + direction[0] * i
             py = ny + direction[1] * i
             if x0 <= px < x0 + size and y0 <= py < y0 + size:
-                draw.point((px, py), fill=needle_color)
+                points[px, py] = needle_color
+        draw_color_points(draw, points)
 
 def generate_birch_leaves(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str = 'all') -> None:
     """Birch leaves with light, delicate appearance."""
@@ -323,10 +353,12 @@ def generate_birch_leaves(draw: ImageDraw.Draw, x0: int, y0: int, size: int, fac
     
     # Add light spots (characteristic of birch)
     light_color = (220, 255, 220, 255)
+    points = {}
     for _ in range(size // 3):
         lx = random.randint(x0, x0 + size - 1)
         ly = random.randint(y0, y0 + size - 1)
-        draw.point((lx, ly), fill=light_color)
+        points[lx, ly] = light_color
+    draw_color_points(draw, points)
 
 def generate_palm_fronds(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str = 'all') -> None:
     """Palm fronds with long, flowing patterns."""
@@ -337,11 +369,13 @@ def generate_palm_fronds(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face
     frond_color = (124, 252, 0, 255)  # Bright green
     for i in range(0, size, 4):  # Every 4 pixels
         # Draw diagonal frond segments
+        points = {}
         for y in range(y0, y0 + size, 2):
             fx = x0 + i + ((y - y0) // 4) % 3 - 1  # Slight diagonal offset
             fy = y
             if x0 <= fx < x0 + size and y0 <= fy < y0 + size:
-                draw.point((fx, fy), fill=frond_color)
+                points[fx, fy] = frond_color
+        draw_color_points(draw, points)
 
 def generate_brown_mushroom(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str = 'all') -> None:
     """Brown mushroom with cap pattern."""
@@ -351,6 +385,7 @@ def generate_brown_mushroom(draw: ImageDraw.Draw, x0: int, y0: int, size: int, f
     
     # Add mushroom spots
     spot_color = (160, 82, 45, 255)  # Lighter brown
+    points = {}
     for _ in range(size // 4):
         sx = random.randint(x0, x0 + size - 1)
         sy = random.randint(y0, y0 + size - 1)
@@ -361,7 +396,8 @@ def generate_brown_mushroom(draw: ImageDraw.Draw, x0: int, y0: int, size: int, f
             for dy in range(-spot_size, spot_size + 1):
                 if dx*dx + dy*dy <= spot_size*spot_size:
                     if x0 <= sx + dx < x0 + size and y0 <= sy + dy < y0 + size:
-                        draw.point((sx + dx, sy + dy), fill=spot_color)
+                        points[sx + dx, sy + dy] = spot_color
+    draw_color_points(draw, points)
 
 def generate_red_mushroom(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str = 'all') -> None:
     """Red mushroom with white spots."""
@@ -371,6 +407,7 @@ def generate_red_mushroom(draw: ImageDraw.Draw, x0: int, y0: int, size: int, fac
     
     # Add white spots
     spot_color = (255, 255, 255, 255)  # White
+    points = {}
     for _ in range(size // 3):
         sx = random.randint(x0, x0 + size - 1)
         sy = random.randint(y0, y0 + size - 1)
@@ -381,7 +418,8 @@ def generate_red_mushroom(draw: ImageDraw.Draw, x0: int, y0: int, size: int, fac
             for dy in range(-spot_size, spot_size + 1):
                 if dx*dx + dy*dy <= spot_size*spot_size:
                     if x0 <= sx + dx < x0 + size and y0 <= sy + dy < y0 + size:
-                        draw.point((sx + dx, sy + dy), fill=spot_color)
+                        points[sx + dx, sy + dy] = spot_color
+    draw_color_points(draw, points)
 
 def generate_cactus(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str = 'all') -> None:
     """Cactus with spines and desert coloring."""
@@ -391,17 +429,21 @@ def generate_cactus(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str
     
     # Add cactus spines
     spine_color = (255, 255, 255, 255)  # White spines
+    points = {}
     for _ in range(size // 2):
         sx = random.randint(x0, x0 + size - 1)
         sy = random.randint(y0, y0 + size - 1)
-        draw.point((sx, sy), fill=spine_color)
+        points[sx, sy] = spine_color
+    draw_color_points(draw, points)
     
     # Add vertical ridges
     ridge_color = (0, 100, 0, 255)  # Darker green
+    points = {}
     for x in range(x0 + size // 4, x0 + size, size // 4):
         for y in range(y0, y0 + size):
             if random.random() < 0.6:  # 60% coverage
-                draw.point((x, y), fill=ridge_color)
+                points[x, y] = ridge_color
+    draw_color_points(draw, points)
 
 def generate_jungle_vine(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str) -> None:
     """Jungle vines with hanging texture patterns."""
@@ -412,11 +454,13 @@ def generate_jungle_vine(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face
     vine_color = (20, 100, 20, 255)
     for i in range(3, size, 6):  # Every 6 pixels, starting from 3
         x = x0 + i
+        points = {}
         for y in range(y0, y0 + size):
             if random.random() < 0.8:  # 80% chance for each pixel
                 offset = random.randint(-1, 1)
                 vine_x = max(x0, min(x0 + size - 1, x + offset))
-                draw.point((vine_x, y), fill=vine_color)
+                points[vine_x, y] = vine_color
+        draw_color_points(draw, points)
 
 def generate_pink_coral(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str) -> None:
     """Pink coral with branching patterns."""
@@ -425,6 +469,7 @@ def generate_pink_coral(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face:
     
     # Add coral branch patterns
     branch_color = (255, 20, 147, 255)  # Deep pink
+    points = {}
     for _ in range(size // 3):
         # Random branch starting point
         bx = random.randint(x0, x0 + size - 1)
@@ -436,7 +481,8 @@ def generate_pink_coral(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face:
                 new_x = bx + angle[0] * length
                 new_y = by + angle[1] * length
                 if x0 <= new_x < x0 + size and y0 <= new_y < y0 + size:
-                    draw.point((new_x, new_y), fill=branch_color)
+                    points[new_x, new_y] = branch_color
+    draw_color_points(draw, points)
 
 def generate_blue_coral(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str) -> None:
     """Blue coral with branching patterns."""
@@ -445,6 +491,7 @@ def generate_blue_coral(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face:
     
     # Add coral branch patterns
     branch_color = (0, 191, 255, 255)  # Deep sky blue
+    points = {}
     for _ in range(size // 3):
         # Random branch starting point
         bx = random.randint(x0, x0 + size - 1)
@@ -456,7 +503,8 @@ def generate_blue_coral(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face:
                 new_x = bx + angle[0] * length
                 new_y = by + angle[1] * length
                 if x0 <= new_x < x0 + size and y0 <= new_y < y0 + size:
-                    draw.point((new_x, new_y), fill=branch_color)
+                    points[new_x, new_y] = branch_color
+    draw_color_points(draw, points)
 
 def generate_seaweed(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str) -> None:
     """Seaweed with flowing patterns."""
@@ -467,13 +515,15 @@ def generate_seaweed(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: st
     strand_color = (76, 175, 80, 255)  # Lighter green
     for i in range(2, size, 8):  # Every 8 pixels
         x = x0 + i
+        points = {}
         for y in range(y0, y0 + size):
             # Create wavy pattern
             wave = int(2 * ((y - y0) / size * 3.14159 * 2))
             wave_offset = wave % 3 - 1
             strand_x = max(x0, min(x0 + size - 1, x + wave_offset))
             if random.random() < 0.7:  # 70% density
-                draw.point((strand_x, y), fill=strand_color)
+                points[strand_x, y] = strand_color
+        draw_color_points(draw, points)
 
 def generate_tundra_moss(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str) -> None:
     """Tundra moss with sparse, low-growing pattern."""
@@ -494,10 +544,12 @@ def generate_tundra_moss(draw: ImageDraw.Draw, x0: int, y0: int, size: int, face
         
         # Small moss patch (1-3 pixels)
         patch_size = random.randint(1, 3)
+        points = {}
         for dx in range(patch_size):
             for dy in range(patch_size):
                 if mx + dx < x0 + size and my + dy < y0 + size:
-                    draw.point((mx + dx, my + dy), fill=moss_color)
+                    points[mx + dx, my + dy] = moss_color
+        draw_color_points(draw, points)
 
 # Lookup table for organic generators
 ORGANIC_GENERATORS = {
@@ -534,20 +586,24 @@ def generate_organic_texture_draw(draw: ImageDraw.Draw, x0: int, y0: int, size:
             draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=base_color)
             
             # Add grass blades
+            points = {}
             for _ in range(size // 2):
                 blade_x = random.randint(x0, x0 + size - 1)
                 blade_y = random.randint(y0, y0 + size - 1)
                 blade_color = (139, 195, 74, 255)  # Light green
-                draw.point((blade_x, blade_y), fill=blade_color)
+                points[blade_x, blade_y] = blade_color
+            draw_color_points(draw, points)
         else:
             # Grass sides - dirt with grass edge at top
             generate_organic_texture_draw(draw, x0, y0, size, 'dirt', face)
             if face == 'side':
                 # Add green strip at top
                 grass_color = (76, 175, 80, 255)
+                points = {}
                 for x in range(x0, x0 + size):
                     for y in range(y0, min(y0 + 3, y0 + size)):
-                        draw.point((x, y), fill=grass_color)
+                        points[x, y] = grass_color
+                draw_color_points(draw, points)
     
     elif subtype == 'sand':
         # Generate sand texture
@@ -555,15 +611,17 @@ def generate_organic_texture_draw(draw: ImageDraw.Draw, x0: int, y0: int, size:
         draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=base_color)
         
         # Add sand grain texture
+        points = {}
         for _ in range(size * 3):
             grain_x = random.randint(x0, x0 + size - 1)
             grain_y = random.randint(y0, y0 + size - 1)
             if random.random() < 0.2:
                 grain_color = (255, 248, 220, 255)  # Lighter sand
-                draw.point((grain_x, grain_y), fill=grain_color)
+                points[grain_x, grain_y] = grain_color
             elif random.random() < 0.1:
                 grain_color = (238, 203, 173, 255)  # Darker sand
-                draw.point((grain_x, grain_y), fill=grain_color)
+                points[grain_x, grain_y] = grain_color
+        draw_color_points(draw, points)
     
     elif subtype == 'topsoil':
         # Rich topsoil - darker than regular dirt
@@ -571,12 +629,14 @@ def generate_organic_texture_draw(draw: ImageDraw.Draw, x0: int, y0: int, size:
         draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=base_color)
         
         # Add organic matter spots
+        points = {}
         for _ in range(size):
             spot_x = random.randint(x0, x0 + size - 1)
             spot_y = random.randint(y0, y0 + size - 1)
             if random.random() < 0.4:
                 spot_color = (33, 33, 33, 255)  # Very dark organic matter
-                draw.point((spot_x, spot_y), fill=spot_color)
+                points[spot_x, spot_y] = spot_color
+        draw_color_points(draw, points)
     
     elif subtype == 'subsoil':
         # Clay-rich subsoil
@@ -584,11 +644,13 @@ def generate_organic_texture_draw(draw: ImageDraw.Draw, x0: int, y0: int, size:
         draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=base_color)
         
         # Add clay texture
+        points = {}
         for _ in range(size // 2):
             clay_x = random.randint(x0, x0 + size - 1)
             clay_y = random.randint(y0, y0 + size - 1)
             clay_color = (160, 82, 45, 255)  # Saddle brown
-            draw.point((clay_x, clay_y), fill=clay_color)
+            points[clay_x, clay_y] = clay_color
+        draw_color_points(draw, points)
     
     elif subtype in ['oak_leaves', 'leaves_oak']:
         generate_oak_leaves(draw, x0, y0, size, face)
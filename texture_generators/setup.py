@@ -0,0 +1,27 @@
+from setuptools import setup, Extension
+import os
+import platform
+
+# Build in place with: python setup.py build_ext --inplace
+# The texture generators fall back to NumPy when the extension is not built.
+extra_compile_args = ["-O3"]
+# AVX2 is opt-in (SPECKLE_AVX2=1): a module built with it crashes on x86_64
+# CPUs without AVX2, and -O3 already vectorizes the hash loop for the baseline ISA
+if os.environ.get("SPECKLE_AVX2") == "1" and platform.machine().lower() in ("x86_64", "amd64"):
+    extra_compile_args.append("-mavx2")
+
+# Define the extension module
+ext_modules = [
+    Extension(
+        "_speckle",
+        ["_speckle.c"],
+        extra_compile_args=extra_compile_args,
+    ),
+]
+
+setup(
+    name="texture_generators_speckle",
+    ext_modules=ext_modules,
+    zip_safe=False,
+    python_requires=">=3.6",
+)
@@ -9,7 +9,7 @@ Designed for 25cm×25cm voxel scale for enhanced detail.
 
 from PIL import Image, ImageDraw
 import random
-from texture_generators.base_patterns import draw_speckled_pattern, draw_grain_pattern
+from texture_generators.base_patterns import draw_speckled_pattern, draw_grain_pattern, draw_color_points
 from texture_generators.color_palettes import get_palette, vary_color
 
 def generate_invisible_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
@@ -24,14 +24,16 @@ def generate_invisible_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int)
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add very subtle shimmer effects (barely visible)
+    points = {}
     for _ in range(size // 8):
         sx = random.randint(x0, x0 + size - 1)
         sy = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.3:
-            draw.point((sx, sy), fill=palette['shimmer'])
+            points[sx, sy] = palette['shimmer']
         elif random.random() < 0.5:
-            draw.point((sx, sy), fill=palette['edge'])
+            points[sx, sy] = palette['edge']
+    draw_color_points(draw, points)
 
 def generate_intangible_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Intangible block - ghostly, semi-transparent appearance."""
@@ -46,16 +48,18 @@ def generate_intangible_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int)
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add ghostly patterns
+    points = {}
     for _ in range(size * size // 6):
         gx = random.randint(x0, x0 + size - 1)
         gy = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.4:
-            draw.point((gx, gy), fill=palette['wisp'])
+            points[gx, gy] = palette['wisp']
         elif random.random() < 0.6:
-            draw.point((gx, gy), fill=palette['fade'])
+            points[gx, gy] = palette['fade']
         elif random.random() < 0.8:
-            draw.point((gx, gy), fill=palette['spirit'])
+            points[gx, gy] = palette['spirit']
+    draw_color_points(draw, points)
 
 def generate_antigrav_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Anti-gravity block with levitating particle effects."""
@@ -103,6 +107,7 @@ def generate_magnetic_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -
     
     # Add magnetic field line patterns
     field_lines = size // 4
+    points = {}
     for _ in range(field_lines):
         # Curved field lines from center
         center_x = x0 + size // 2
@@ -122,7 +127,8 @@ def generate_magnetic_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -
             fy = int(start_y + t * (center_y - start_y) * 0.5)
             
             if x0 <= fx < x0 + size and y0 <= fy < y0 + size:
-                draw.point((fx, fy), fill=palette['field'])
+                points[fx, fy] = palette['field']
+    draw_color_points(draw, points)
     
     # Add magnetic pole indicators
     pole_count = 2
@@ -149,16 +155,19 @@ def generate_temporal_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add temporal distortion patterns
+    points = {}
     for _ in range(size * size // 8):
         tx = random.randint(x0, x0 + size - 1)
         ty = random.randint(y0, y0 + size - 1)
         
         # Random temporal effects
         time_effect = random.choice(['past', 'future', 'distortion'])
-        draw.point((tx, ty), fill=palette[time_effect])
+        points[tx, ty] = palette[time_effect]
+    draw_color_points(draw, points)
     
     # Add temporal waves
     wave_count = size // 6
+    points = {}
     for _ in range(wave_count):
         center_x = x0 + size // 2
         center_y = y0 + size // 2
@@ -173,7 +182,8 @@ def generate_temporal_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -
             wy = center_y + int(wave_radius * (0.5 + 0.5 * ((angle + 1.57) / 6.28)))
             
             if x0 <= wx < x0 + size and y0 <= wy < y0 + size:
-                draw.point((wx, wy), fill=palette['distortion'])
+                points[wx, wy] = palette['distortion']
+    draw_color_points(draw, points)
 
 def generate_dimensional_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Dimensional block with portal-like properties."""
@@ -192,6 +202,7 @@ def generate_dimensional_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int
     portal_center_y = y0 + size // 2
     
     # Concentric portal rings
+    points = {}
     for ring in range(1, size // 4):
         ring_radius = ring * 2
         ring_points = ring * 4
@@ -203,15 +214,18 @@ def generate_dimensional_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int
             
             if x0 <= px < x0 + size and y0 <= py < y0 + size:
                 if ring % 2 == 0:
-                    draw.point((px, py), fill=palette['portal'])
+                    points[px, py] = palette['portal']
                 else:
-                    draw.point((px, py), fill=palette['energy'])
+                    points[px, py] = palette['energy']
+    draw_color_points(draw, points)
     
     # Add void spaces
+    points = {}
     for _ in range(size // 8):
         vx = random.randint(x0, x0 + size - 1)
         vy = random.randint(y0, y0 + size - 1)
-        draw.point((vx, vy), fill=palette['void'])
+        points[vx, vy] = palette['void']
+    draw_color_points(draw, points)
 
 def generate_regenerating_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Self-healing block with regeneration patterns."""
@@ -226,16 +240,18 @@ def generate_regenerating_block(draw: ImageDraw.Draw, x0: int, y0: int, size: in
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add regeneration patterns
+    points = {}
     for _ in range(size * size // 6):
         rx = random.randint(x0, x0 + size - 1)
         ry = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.4:
-            draw.point((rx, ry), fill=palette['heal'])
+            points[rx, ry] = palette['heal']
         elif random.random() < 0.6:
-            draw.point((rx, ry), fill=palette['growth'])
+            points[rx, ry] = palette['growth']
         elif random.random() < 0.8:
-            draw.point((rx, ry), fill=palette['life'])
+            points[rx, ry] = palette['life']
+    draw_color_points(draw, points)
     
     # Add healing pulses
     pulse_count = size // 8
@@ -263,25 +279,29 @@ def generate_explosive_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int)
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add unstable energy patterns
+    points = {}
     for _ in range(size * size // 5):
         ex = random.randint(x0, x0 + size - 1)
         ey = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.4:
-            draw.point((ex, ey), fill=palette['unstable'])
+            points[ex, ey] = palette['unstable']
         elif random.random() < 0.6:
-            draw.point((ex, ey), fill=palette['spark'])
+            points[ex, ey] = palette['spark']
         elif random.random() < 0.8:
-            draw.point((ex, ey), fill=palette['danger'])
+            points[ex, ey] = palette['danger']
+    draw_color_points(draw, points)
     
     # Add warning pattern (diagonal stripes)
     stripe_count = size // 4
+    points = {}
     for i in range(stripe_count):
         stripe_y = y0 + (size // stripe_count) * i
         for x in range(x0, x0 + size):
             if (x + stripe_y) % 4 == 0:  # Simple diagonal pattern
                 if y0 <= stripe_y < y0 + size:
-                    draw.point((x, stripe_y), fill=palette['danger'])
+                    points[x, stripe_y] = palette['danger']
+    draw_color_points(draw, points)
 
 def generate_absorbing_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Energy-absorbing block with dampening properties."""
@@ -296,16 +316,18 @@ def generate_absorbing_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int)
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add absorption patterns
+    points = {}
     for _ in range(size * size // 7):
         ax = random.randint(x0, x0 + size - 1)
         ay = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.5:
-            draw.point((ax, ay), fill=palette['absorb'])
+            points[ax, ay] = palette['absorb']
         elif random.random() < 0.7:
-            draw.point((ax, ay), fill=palette['dampen'])
+            points[ax, ay] = palette['dampen']
         elif random.random() < 0.9:
-            draw.point((ax, ay), fill=palette['null'])
+            points[ax, ay] = palette['null']
+    draw_color_points(draw, points)
 
 def generate_amplifying_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Energy-amplifying block with boosting properties."""
@@ -320,19 +342,22 @@ def generate_amplifying_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int)
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
     
     # Add amplification patterns
+    points = {}
     for _ in range(size * size // 6):
         ax = random.randint(x0, x0 + size - 1)
         ay = random.randint(y0, y0 + size - 1)
         
         if random.random() < 0.4:
-            draw.point((ax, ay), fill=palette['boost'])
+            points[ax, ay] = palette['boost']
         elif random.random() < 0.6:
-            draw.point((ax, ay), fill=palette['amplify'])
+            points[ax, ay] = palette['amplify']
         elif random.random() < 0.8:
-            draw.point((ax, ay), fill=palette['power'])
+            points[ax, ay] = palette['power']
+    draw_color_points(draw, points)
     
     # Add energy focusing lines
     focus_lines = size // 6
+    points = {}
     for _ in range(focus_lines):
         # Energy concentration lines toward center
         center_x = x0 + size // 2
@@ -348,7 +373,8 @@ def generate_amplifying_block(draw: ImageDraw.Draw, x0: int, y0: int, size: int)
             ly = int(start_y + t * (center_y - start_y))
             
             if x0 <= lx < x0 + size and y0 <= ly < y0 + size:
-                draw.point((lx, ly), fill=palette['amplify'])
+                points[lx, ly] = palette['amplify']
+    draw_color_points(draw, points)
 
 # Lookup table for special generators
 SPECIAL_GENERATORS = {
@@ -395,20 +421,24 @@ def generate_special_texture(subtype: str, size: int = 32) -> 'Image':
         draw.rectangle([0, 0, size - 1, size - 1], fill=palette['base'])
         
         # Add sparkle/crystal effects
+        points = {}
         for _ in range(size // 2):
             sx = random.randint(0, size - 1)
             sy = random.randint(0, size - 1)
             if random.random() < 0.3:
-                draw.point((sx, sy), fill=palette['crystal'])
+                points[sx, sy] = palette['crystal']
             elif random.random() < 0.2:
-                draw.point((sx, sy), fill=palette['blue'])
+                points[sx, sy] = palette['blue']
+        draw_color_points(draw, points)
         
         # Add subtle texture
+        points = {}
         for _ in range(size):
             tx = random.randint(0, size - 1)
             ty = random.randint(0, size - 1)
             if random.random() < 0.15:
-                draw.point((tx, ty), fill=palette['shadow'])
+                points[tx, ty] = palette['shadow']
+        draw_color_points(draw, points)
     
     elif subtype == 'ice':
         # Ice texture - blue-tinted transparent
@@ -423,15 +453,18 @@ def generate_special_texture(subtype: str, size: int = 32) -> 'Image':
         draw.rectangle([0, 0, size - 1, size - 1], fill=palette['base'])
         
         # Add ice crystal patterns
+        points = {}
         for _ in range(size // 3):
             cx = random.randint(0, size - 1)
             cy = random.randint(0, size - 1)
             if random.random() < 0.4:
-                draw.point((cx, cy), fill=palette['crystal'])
+                points[cx, cy] = palette['crystal']
             elif random.random() < 0.2:
-                draw.point((cx, cy), fill=palette['clear'])
+                points[cx, cy] = palette['clear']
+        draw_color_points(draw, points)
         
         # Add some ice crack lines
+        points = {}
         for _ in range(size // 8):
             start_x = random.randint(0, size - 1)
             start_y = random.randint(0, size - 1)
@@ -442,7 +475,8 @@ def generate_special_texture(subtype: str, size: int = 32) -> 'Image':
                 crack_x = start_x + i * direction[0]
                 crack_y = start_y + i * direction[1]
                 if 0 <= crack_x < size and 0 <= crack_y < size:
-                    draw.point((crack_x, crack_y), fill=palette['crack'])
+                    points[crack_x, crack_y] = palette['crack']
+        draw_color_points(draw, points)
     
     elif subtype == 'packed_ice':
         # Packed ice - denser, darker blue
@@ -457,19 +491,23 @@ def generate_special_texture(subtype: str, size: int = 32) -> 'Image':
         draw.rectangle([0, 0, size - 1, size - 1], fill=palette['base'])
         
         # Add density variations
+        points = {}
         for _ in range(size):
             dx = random.randint(0, size - 1)
             dy = random.randint(0, size - 1)
             if random.random() < 0.3:
-                draw.point((dx, dy), fill=palette['dense'])
+                points[dx, dy] = palette['dense']
             elif random.random() < 0.1:
-                draw.point((dx, dy), fill=palette['dark'])
+                points[dx, dy] = palette['dark']
+        draw_color_points(draw, points)
         
         # Add crystal formations
+        points = {}
         for _ in range(size // 4):
             fx = random.randint(0, size - 1)
             fy = random.randint(0, size - 1)
-            draw.point((fx, fy), fill=palette['crystal'])
+            points[fx, fy] = palette['crystal']
+        draw_color_points(draw, points)
     
     elif subtype == 'charcoal_block':
         # Charcoal block - black with carbon texture
@@ -484,15 +522,17 @@ def generate_special_texture(subtype: str, size: int = 32) -> 'Image':
         draw.rectangle([0, 0, size - 1, size - 1], fill=palette['base'])
         
         # Add carbon texture
+        points = {}
         for _ in range(size * 2):
             cx = random.randint(0, size - 1)
             cy = random.randint(0, size - 1)
             if random.random() < 0.4:
-                draw.point((cx, cy), fill=palette['carbon'])
+                points[cx, cy] = palette['carbon']
             elif random.random() < 0.2:
-                draw.point((cx, cy), fill=palette['ash'])
+                points[cx, cy] = palette['ash']
             elif random.random() < 0.05:
-                draw.point((cx, cy), fill=palette['ember'])
+                points[cx, cy] = palette['ember']
+        draw_color_points(draw, points)
     
     elif subtype == 'magical_mist':
         # Magical mist - translucent with swirling patterns
@@ -507,15 +547,17 @@ def generate_special_texture(subtype: str, size: int = 32) -> 'Image':
         draw.rectangle([0, 0, size - 1, size - 1], fill=palette['base'])
         
         # Add swirling patterns
+        points = {}
         for _ in range(size // 2):
             mx = random.randint(0, size - 1)
             my = random.randint(0, size - 1)
             if random.random() < 0.5:
-                draw.point((mx, my), fill=palette['swirl'])
+                points[mx, my] = palette['swirl']
             elif random.random() < 0.2:
-                draw.point((mx, my), fill=palette['magic'])
+                points[mx, my] = palette['magic']
             elif random.random() < 0.3:
-                draw.point((mx, my), fill=palette['deep'])
+                points[mx, my] = palette['deep']
+        draw_color_points(draw, points)
     
     elif subtype == 'steam':
         # Steam - light wispy texture
@@ -6,7 +6,7 @@ Generators for all stone variants using base patterns with stone-specific palett
 """
 
 from PIL import ImageDraw
-from texture_generators.base_patterns import draw_speckled_pattern, draw_vein_pattern, draw_crystalline_pattern
+from texture_generators.base_patterns import draw_speckled_pattern, draw_vein_pattern, draw_crystalline_pattern, draw_color_points
 from texture_generators.color_palettes import get_palette
 
 def generate_basic_stone(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
@@ -64,11 +64,14 @@ def generate_obsidian(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None
     
     # Add glass-like reflections
     import random
+    reflect_colors = (palette['shine'], palette['reflection'])
+    points = {}
     for _ in range(size // 4):
         rx = random.randint(x0, x0 + size - 1)
         ry = random.randint(y0, y0 + size - 1)
-        reflect_color = random.choice([palette['shine'], palette['reflection']])
-        draw.point((rx, ry), fill=reflect_color)
+        reflect_color = random.choice(reflect_colors)
+        points[rx, ry] = reflect_color
+    draw_color_points(draw, points)
 
 def generate_basalt(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Basalt with volcanic, fine-grained texture."""
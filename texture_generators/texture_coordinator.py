@@ -8,13 +8,58 @@ This coordinates between different texture generators and handles per-face logic
 
 from PIL import Image, ImageDraw
 from typing import Dict, Tuple, Optional, List
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import inspect
 import random
+import numpy as np
 
 from texture_generators.base_patterns import *
 from texture_generators.color_palettes import *
+from texture_generators.noise import perlin2d
+from texture_generators import (ceramic_textures, fluid_textures, ore_textures, organic_textures,
+                                stone_textures, wood_textures)
 # Import enhanced generator functions
 from texture_generators.stone_textures_enhanced import generate_stone_texture, generate_processed_stone_texture
-from texture_generators.wood_textures_enhanced import generate_wood_texture, generate_processed_wood_texture
+from texture_generators.wood_textures_enhanced import generate_wood_texture
+
+# Fixed fleck and pebble colors, built once at import as arrays that random
+# indices can pick rows from
+_DIRT_FLECKS = np.array([
+    (80, 50, 30, 255),   # Dark organic
+    (60, 40, 20, 255),   # Root fragment
+    (100, 60, 40, 255)   # Clay particle
+], dtype=np.uint8)
+_GRASS_BLADE = np.array([vary_color(GRASS_GREEN['light'], 20)], dtype=np.uint8)
+_GRAVEL_BASE = (120, 110, 100, 255)
+_PEBBLE_COLORS = np.array([
+    (140, 130, 120, 255),  # Light gray
+    (100, 90, 80, 255),    # Dark gray
+    (130, 115, 95, 255),   # Brown
+    (110, 105, 100, 255)   # Medium gray
+], dtype=np.uint8)
+_BEDROCK_FLECK = np.array([(80, 80, 120, 255)], dtype=np.uint8)  # Slightly blue tint
+_TOPSOIL_ORGANIC = np.array([(40, 25, 15, 255)], dtype=np.uint8)  # Dark organic matter
+_PLACEHOLDER_BASE = (255, 0, 255, 255)
+_PLACEHOLDER_DIAG = (200, 0, 200, 255)
+
+# Face order along axis 1 of generate_atlas
+FACES = ('top', 'bottom', 'side')
+
+# Side of each material's noise source, in tiles; every tile is a random
+# window cropped from it rather than a fresh noise field
+_SOURCE_TILES = 8
+
+@functools.lru_cache(maxsize=None)
+def _detail_counts(size: int) -> Dict[str, int]:
+    """Number of flecks, blades or pebbles each generator scatters on a size x size tile."""
+    return {
+        'dirt': size // 4,
+        'grass_blades': size // 2,
+        'gravel': size // 2,
+        'bedrock': size // 8,
+        'topsoil': size // 6,
+    }
 
 class TextureCoordinator:
     """
@@ -22,6 +67,109 @@ class TextureCoordinator:
     Handles per-face logic and delegates to appropriate generators.
     """
     
+    # Voxel types whose generator ignores the face: one render serves all
+    # three faces. Only the coordinator's own generators are listed, since
+    # the delegated generators receive the face and may use it.
+    FACE_INVARIANT_IDS = frozenset({
+        0,  # AIR
+        2,  # DIRT
+        4,  # SAND
+        5,  # GRAVEL
+        7,  # BEDROCK
+        8,  # TOPSOIL
+        9,  # SUBSOIL
+    })
+    
+    # Voxel types whose generator writes every pixel of the tile, so the
+    # image needs no transparent fill first. The placeholder also qualifies.
+    FULL_COVERAGE_IDS = frozenset({
+        2,  # DIRT
+        3,  # GRASS
+        4,  # SAND
+        5,  # GRAVEL
+        7,  # BEDROCK
+        8,  # TOPSOIL
+        9,  # SUBSOIL
+    })
+    
+    # Generator for each voxel type ID, in ID order, as (generator module,
+    # function name); a None module means a method of the coordinator itself.
+    # Types without a module generator yet fall back to the placeholder.
+    _GENERATORS = (
+        # TERRAIN & NATURAL (0-49)
+        # Basic Terrain (0-9)
+        (None, '_generate_air'),                        # AIR
+        (stone_textures, 'generate_basic_stone'),       # STONE
+        (None, '_generate_dirt'),                       # DIRT
+        (None, '_generate_grass'),                      # GRASS
+        (None, '_generate_sand'),                       # SAND
+        (None, '_generate_gravel'),                     # GRAVEL
+        (ceramic_textures, 'generate_raw_clay'),        # CLAY
+        (None, '_generate_bedrock'),                    # BEDROCK
+        (None, '_generate_topsoil'),                    # TOPSOIL
+        (None, '_generate_subsoil'),                    # SUBSOIL
+        
+        # Stone Varieties (10-19)
+        (stone_textures, 'generate_granite'),           # GRANITE
+        (stone_textures, 'generate_limestone'),         # LIMESTONE
+        (stone_textures, 'generate_marble'),            # MARBLE
+        (stone_textures, 'generate_sandstone'),         # SANDSTONE
+        (stone_textures, 'generate_slate'),             # SLATE
+        (stone_textures, 'generate_basalt'),            # BASALT
+        (stone_textures, 'generate_quartzite'),         # QUARTZITE
+        (stone_textures, 'generate_obsidian'),          # OBSIDIAN
+        (stone_textures, 'generate_pumice'),            # PUMICE
+        (None, '_generate_placeholder'),                # SHALE (no generator yet)
+        
+        # Ores & Minerals (20-29)
+        (ore_textures, 'generate_coal_ore'),            # COAL_ORE
+        (ore_textures, 'generate_iron_ore'),            # IRON_ORE
+        (ore_textures, 'generate_copper_ore'),          # COPPER_ORE
+        (ore_textures, 'generate_tin_ore'),             # TIN_ORE
+        (ore_textures, 'generate_silver_ore'),          # SILVER_ORE
+        (ore_textures, 'generate_gold_ore'),            # GOLD_ORE
+        (ore_textures, 'generate_ruby_gem'),            # GEM_RUBY
+        (ore_textures, 'generate_sapphire_gem'),        # GEM_SAPPHIRE
+        (ore_textures, 'generate_emerald_gem'),         # GEM_EMERALD
+        (ore_textures, 'generate_diamond_gem'),         # GEM_DIAMOND
+        
+        # Organic Natural (30-39)
+        (wood_textures, 'generate_oak_wood'),           # WOOD_OAK
+        (wood_textures, 'generate_pine_wood'),          # WOOD_PINE
+        (wood_textures, 'generate_birch_wood'),         # WOOD_BIRCH
+        (wood_textures, 'generate_mahogany_wood'),      # WOOD_MAHOGANY
+        (organic_textures, 'generate_oak_leaves'),      # LEAVES_OAK
+        (organic_textures, 'generate_pine_needles'),    # LEAVES_PINE
+        (organic_textures, 'generate_birch_leaves'),    # LEAVES_BIRCH
+        (organic_textures, 'generate_palm_fronds'),     # LEAVES_PALM
+        (organic_textures, 'generate_brown_mushroom'),  # MUSHROOM_BROWN
+        (organic_textures, 'generate_red_mushroom'),    # MUSHROOM_RED
+        
+        # Biome Specific (40-49)
+        (None, '_generate_placeholder'),                # SNOW (no generator yet)
+        (None, '_generate_placeholder'),                # ICE (no generator yet)
+        (None, '_generate_placeholder'),                # PACKED_ICE (no generator yet)
+        (organic_textures, 'generate_cactus'),          # CACTUS
+        (organic_textures, 'generate_jungle_vine'),     # JUNGLE_VINE
+        (organic_textures, 'generate_pink_coral'),      # CORAL_PINK
+        (organic_textures, 'generate_blue_coral'),      # CORAL_BLUE
+        (organic_textures, 'generate_seaweed'),         # SEAWEED
+        (organic_textures, 'generate_tundra_moss'),     # TUNDRA_MOSS
+        (None, '_generate_placeholder'),                # DESERT_ROCK (no generator yet)
+        
+        # FLUIDS & GASES (50-59)
+        (fluid_textures, 'generate_water'),             # WATER
+        (fluid_textures, 'generate_lava'),              # LAVA
+        (fluid_textures, 'generate_oil'),               # OIL
+        (fluid_textures, 'generate_acid'),              # ACID
+        (fluid_textures, 'generate_honey'),             # HONEY
+        (fluid_textures, 'generate_steam'),             # STEAM
+        (fluid_textures, 'generate_toxic_gas'),         # TOXIC_GAS
+        (None, '_generate_placeholder'),                # NATURAL_GAS (no generator yet)
+        (None, '_generate_placeholder'),                # MAGICAL_MIST (no generator yet)
+        (None, '_generate_placeholder'),                # SMOKE (no generator yet)
+    )
+    
     def __init__(self, tile_size: int = 32, seed: Optional[int] = None):
         """
         Initialize the texture coordinator.
@@ -31,100 +179,37 @@ class TextureCoordinator:
             seed: Random seed for reproducible texture generation
         """
         self.tile_size = tile_size
+        self.seed = seed
         if seed is not None:
+            # Delegated generators still draw from the random module
             random.seed(seed)
+        # Single random source for the coordinator's own generators; drawn
+        # from the random module when unseeded so random.seed() still applies
+        self.rng = np.random.default_rng(random.getrandbits(32) if seed is None else seed)
         
-        # Initialize all generators
-        self.stone_gen = StoneTextureGenerator()
-        self.wood_gen = WoodTextureGenerator()
-        self.ore_gen = OreTextureGenerator()
-        self.organic_gen = OrganicTextureGenerator()
-        self.special_gen = SpecialTextureGenerator()
-        self.crystal_gen = CrystalTextureGenerator()
-        self.ceramic_gen = CeramicTextureGenerator()
-        self.metal_gen = MetalTextureGenerator()
-        self.fluid_gen = FluidTextureGenerator()
-        
+        # Generation functions indexed by voxel type ID
+        self._dispatch = [self._bind_generator(module, name) for module, name in self._GENERATORS]
         # Map VoxelType enum values to generation functions
-        self.texture_map = self._build_texture_map()
-    
-    def _build_texture_map(self) -> Dict[int, callable]:
-        """Build mapping from voxel type ID to generation function."""
-        return {
-            # TERRAIN & NATURAL (0-49)
-            # Basic Terrain (0-9)
-            0: self._generate_air,           # AIR
-            1: self._generate_stone_basic,   # STONE
-            2: self._generate_dirt,          # DIRT
-            3: self._generate_grass,         # GRASS
-            4: self._generate_sand,          # SAND
-            5: self._generate_gravel,        # GRAVEL
-            6: self._generate_clay,          # CLAY
-            7: self._generate_bedrock,       # BEDROCK
-            8: self._generate_topsoil,       # TOPSOIL
-            9: self._generate_subsoil,       # SUBSOIL
-            
-            # Stone Varieties (10-19)
-            10: self._generate_granite,      # GRANITE
-            11: self._generate_limestone,    # LIMESTONE
-            12: self._generate_marble,       # MARBLE
-            13: self._generate_sandstone,    # SANDSTONE
-            14: self._generate_slate,        # SLATE
-            15: self._generate_basalt,       # BASALT
-            16: self._generate_quartzite,    # QUARTZITE
-            17: self._generate_obsidian,     # OBSIDIAN
-            18: self._generate_pumice,       # PUMICE
-            19: self._generate_shale,        # SHALE
-            
-            # Ores & Minerals (20-29)
-            20: self._generate_coal_ore,     # COAL_ORE
-            21: self._generate_iron_ore,     # IRON_ORE
-            22: self._generate_copper_ore,   # COPPER_ORE
-            23: self._generate_tin_ore,      # TIN_ORE
-            24: self._generate_silver_ore,   # SILVER_ORE
-            25: self._generate_gold_ore,     # GOLD_ORE
-            26: self._generate_gem_ruby,     # GEM_RUBY
-            27: self._generate_gem_sapphire, # GEM_SAPPHIRE
-            28: self._generate_gem_emerald,  # GEM_EMERALD
-            29: self._generate_gem_diamond,  # GEM_DIAMOND
-            
-            # Organic Natural (30-39)
-            30: self._generate_wood_oak,     # WOOD_OAK
-            31: self._generate_wood_pine,    # WOOD_PINE
-            32: self._generate_wood_birch,   # WOOD_BIRCH
-            33: self._generate_wood_mahogany,# WOOD_MAHOGANY
-            34: self._generate_leaves_oak,   # LEAVES_OAK
-            35: self._generate_leaves_pine,  # LEAVES_PINE
-            36: self._generate_leaves_birch, # LEAVES_BIRCH
-            37: self._generate_leaves_palm,  # LEAVES_PALM
-            38: self._generate_mushroom_brown, # MUSHROOM_BROWN
-            39: self._generate_mushroom_red,   # MUSHROOM_RED
-            
-            # Biome Specific (40-49)
-            40: self._generate_snow,         # SNOW
-            41: self._generate_ice,          # ICE
-            42: self._generate_packed_ice,   # PACKED_ICE
-            43: self._generate_cactus,       # CACTUS
-            44: self._generate_jungle_vine,  # JUNGLE_VINE
-            45: self._generate_coral_pink,   # CORAL_PINK
-            46: self._generate_coral_blue,   # CORAL_BLUE
-            47: self._generate_seaweed,      # SEAWEED
-            48: self._generate_tundra_moss,  # TUNDRA_MOSS
-            49: self._generate_desert_rock,  # DESERT_ROCK
-            
-            # FLUIDS & GASES (50-59)
-            50: self._generate_water,        # WATER
-            51: self._generate_lava,         # LAVA
-            52: self._generate_oil,          # OIL
-            53: self._generate_acid,         # ACID
-            54: self._generate_honey,        # HONEY
-            55: self._generate_steam,        # STEAM
-            56: self._generate_toxic_gas,    # TOXIC_GAS
-            57: self._generate_natural_gas,  # NATURAL_GAS
-            58: self._generate_magical_mist, # MAGICAL_MIST
-            59: self._generate_smoke,        # SMOKE
+        self.texture_map = dict(enumerate(self._dispatch))
+        
+        # The placeholder is identical for every unmapped type, so render it once
+        self._placeholder_tile = self._render_placeholder(tile_size)
+        # One canvas and Draw reused by every generate_texture call, which
+        # hands out copies; not safe to share across threads
+        self._canvas = Image.new('RGBA', (tile_size, tile_size), (0, 0, 0, 0))
+        self._draw = ImageDraw.Draw(self._canvas)
+        # Detail counts for tile_size, looked up rather than recomputed per call
+        self._counts = _detail_counts(tile_size)
+        # Noise sources for the materials shaded from noise, computed once
+        # per coordinator; features keep the same scale per tile as a
+        # tile-sized field with two lattice cells across
+        source_size = tile_size * _SOURCE_TILES
+        self._material_source = {
+            'dirt': perlin2d((source_size, source_size), octaves=3, seed=self.rng,
+                             base_cells=2 * _SOURCE_TILES),
         }
     
+    
     def generate_texture(self, voxel_type_id: int, face: str = 'all') -> Image.Image:
         """
         Generate texture for a specific voxel type and face.
@@ -136,36 +221,108 @@ class TextureCoordinator:
         Returns:
             PIL Image with the generated texture
         """
-        # Create image
-        img = Image.new('RGBA', (self.tile_size, self.tile_size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
         # Get generation function
-        gen_func = self.texture_map.get(voxel_type_id, self._generate_placeholder)
+        if 0 <= voxel_type_id < len(self._dispatch):
+            gen_func = self._dispatch[voxel_type_id]
+        else:
+            gen_func = self._generate_placeholder
+        
+        # Clear the shared canvas, unless the generator overwrites every
+        # pixel anyway
+        if voxel_type_id not in self.FULL_COVERAGE_IDS and gen_func != self._generate_placeholder:
+            self._canvas.paste((0, 0, 0, 0), (0, 0, self.tile_size, self.tile_size))
         
         # Generate texture
-        gen_func(draw, 0, 0, self.tile_size, face)
+        gen_func(self._draw, 0, 0, self.tile_size, face)
         
-        return img
+        return self._canvas.copy()
     
     def generate_all_textures(self) -> Dict[int, Dict[str, Image.Image]]:
         """
         Generate all textures for all voxel types.
         
         Returns:
-            Dictionary mapping voxel_type_id -> face -> Image
+            Dictionary mapping voxel_type_id -> face -> Image; types in
+            FACE_INVARIANT_IDS share one Image across their faces
         """
-        all_textures = {}
+        return {voxel_type_id: self.generate_faces(voxel_type_id)
+                for voxel_type_id in self.texture_map.keys()}
+    
+    def generate_faces(self, voxel_type_id: int) -> Dict[str, Image.Image]:
+        """
+        Generate the top, bottom and side textures of one voxel type.
         
+        Returns:
+            Dictionary mapping face -> Image; types in FACE_INVARIANT_IDS
+            share one Image across their faces
+        """
+        if voxel_type_id in self.FACE_INVARIANT_IDS:
+            texture = self.generate_texture(voxel_type_id, 'all')
+            return {'top': texture, 'bottom': texture, 'side': texture}
+        
+        return {
+            'top': self.generate_texture(voxel_type_id, 'top'),
+            'bottom': self.generate_texture(voxel_type_id, 'bottom'),
+            'side': self.generate_texture(voxel_type_id, 'side')
+        }
+    
+    def generate_atlas(self) -> np.ndarray:
+        """
+        Generate all textures packed into one contiguous RGBA array.
+        
+        Returns:
+            uint8 array of shape (voxel types, len(FACES), tile_size, tile_size, 4)
+            indexed by voxel type ID and FACES order; unmapped IDs stay transparent
+        """
+        atlas = np.zeros((len(self._dispatch), len(FACES), self.tile_size, self.tile_size, 4),
+                         dtype=np.uint8)
         for voxel_type_id in self.texture_map.keys():
-            all_textures[voxel_type_id] = {
-                'top': self.generate_texture(voxel_type_id, 'top'),
-                'bottom': self.generate_texture(voxel_type_id, 'bottom'),
-                'side': self.generate_texture(voxel_type_id, 'side')
-            }
+            faces = self.generate_faces(voxel_type_id)
+            for face_index, face in enumerate(FACES):
+                atlas[voxel_type_id, face_index] = np.asarray(faces[face])
+        return atlas
+    
+    def generate_all_textures_parallel(self, workers: Optional[int] = None) -> Dict[int, Dict[str, Image.Image]]:
+        """
+        Generate all textures for all voxel types in parallel worker processes.
+        
+        Each voxel type gets its own coordinator seeded with seed + voxel_type_id,
+        so the result does not depend on worker scheduling.
         
+        Args:
+            workers: Number of worker processes (defaults to the CPU count)
+        
+        Returns:
+            Same layout as generate_all_textures
+        """
+        # An unseeded coordinator still draws its base seed from the random
+        # module, so random.seed() controls parallel builds too
+        base_seed = random.getrandbits(32) if self.seed is None else self.seed
+        jobs = [(self.tile_size, base_seed + voxel_type_id, voxel_type_id)
+                for voxel_type_id in self.texture_map.keys()]
+        
+        all_textures = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for (_, _, voxel_type_id), faces in zip(jobs, pool.map(_generate_faces_job, jobs)):
+                # Faces that shared an Image in the worker arrive as one payload
+                images = {}
+                for payload in faces.values():
+                    if id(payload) not in images:
+                        mode, pixels = payload
+                        images[id(payload)] = Image.frombytes(mode, (self.tile_size, self.tile_size), pixels)
+                all_textures[voxel_type_id] = {face: images[id(payload)] for face, payload in faces.items()}
         return all_textures
     
+    def _bind_generator(self, module, name: str):
+        """Generation function for one _GENERATORS entry, called as (draw, x0, y0, size, face)."""
+        if module is None:
+            return getattr(self, name)
+        func = getattr(module, name)
+        if 'face' in inspect.signature(func).parameters:
+            return func
+        # Generators without a face parameter draw every face alike
+        return lambda draw, x0, y0, size, face: func(draw, x0, y0, size)
+    
     # ========== TERRAIN & NATURAL GENERATORS ==========
     
     def _generate_air(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
@@ -173,285 +330,152 @@ class TextureCoordinator:
         # Completely transparent, no drawing needed
         pass
     
-    def _generate_stone_basic(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        """Basic stone"""
-        self.stone_gen.generate_basic_stone(draw, x0, y0, size, face)
+    def _counts_for(self, size: int) -> Dict[str, int]:
+        """Detail counts for a size x size tile, precomputed for tile_size."""
+        return self._counts if size == self.tile_size else _detail_counts(size)
+    
+    def _noise_window(self, material: str, size: int) -> np.ndarray:
+        """Random size x size window of a material's noise source."""
+        source = self._material_source[material]
+        if size > source.shape[0]:
+            return perlin2d((size, size), octaves=3, seed=self.rng)
+        oy, ox = self.rng.integers(0, source.shape[0] - size + 1, 2)
+        return source[oy:oy + size, ox:ox + size]
+    
+    def _scatter_flecks(self, tile: np.ndarray, count: int, colors: np.ndarray):
+        """Write count single-pixel flecks at random spots, each a random row of colors."""
+        size = tile.shape[0]
+        ys, xs = self.rng.integers(0, size, (2, count))
+        # Later flecks win where they overlap, like sequential point draws
+        tile[ys, xs] = colors[self.rng.integers(0, len(colors), count)]
+    
+    def _speckled_tile(self, size: int, palette: dict, density: int, variation: int) -> np.ndarray:
+        """Speckled base tile as a (size, size, 4) RGBA array."""
+        tile = np.empty((size, size, 4), dtype=np.uint8)
+        speckle_array(tile, palette, density, variation, seed=int(self.rng.integers(1 << 32)))
+        return tile
     
     def _generate_dirt(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
         """Dirt with organic particles"""
-        draw_speckled_pattern(draw, x0, y0, size, DIRT_BROWN, density=6, variation=25)
+        noise = self._noise_window('dirt', size)
+        # Blend from the base color toward the dark or light speckle color
+        # by the sign and strength of the noise
+        t = np.clip(noise * 2, -1, 1)[..., None]
+        base = np.array(DIRT_BROWN['base'], dtype=np.float32)
+        target = np.where(t < 0, np.array(DIRT_BROWN['dark_speckle'], dtype=np.float32),
+                          np.array(DIRT_BROWN['light_speckle'], dtype=np.float32))
+        tile = np.ascontiguousarray(base + np.abs(t) * (target - base) + 0.5, dtype=np.uint8)
         # Add some organic flecks
-        for _ in range(size // 4):
-            fx = random.randint(x0, x0 + size - 1)
-            fy = random.randint(y0, y0 + size - 1)
-            fleck_color = random.choice([
-                (80, 50, 30, 255),   # Dark organic
-                (60, 40, 20, 255),   # Root fragment
-                (100, 60, 40, 255)   # Clay particle
-            ])
-            draw.point((fx, fy), fill=fleck_color)
+        self._scatter_flecks(tile, self._counts_for(size)['dirt'], _DIRT_FLECKS)
+        paste_array(draw, tile, x0, y0)
     
     def _generate_grass(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
         """Grass with different faces"""
+        if face == 'bottom':
+            # Grass bottom - dirt
+            self._generate_dirt(draw, x0, y0, size, face)
+            return
+        
+        tile = np.empty((size, size, 4), dtype=np.uint8)
         if face == 'top':
             # Grass top - green with blade patterns
-            draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], 
-                         fill=GRASS_GREEN['base'])
+            tile[:] = GRASS_GREEN['base']
             
             # Add grass blade details
-            for _ in range(size // 2):
-                bx = random.randint(x0, x0 + size - 1)
-                by = random.randint(y0, y0 + size - 1)
-                blade_color = vary_color(GRASS_GREEN['light'], 20)
-                draw.point((bx, by), fill=blade_color)
-        
-        elif face == 'bottom':
-            # Grass bottom - dirt
-            self._generate_dirt(draw, x0, y0, size, face)
+            self._scatter_flecks(tile, self._counts_for(size)['grass_blades'], _GRASS_BLADE)
         
         else:  # side
             # Grass side - dirt bottom, grass top
-            mid_y = y0 + (size * 3) // 4  # Grass takes top 1/4
+            mid_y = (size * 3) // 4  # Grass takes top 1/4
             
             # Dirt portion (bottom)
-            draw.rectangle([x0, mid_y, x0 + size - 1, y0 + size - 1], 
-                         fill=DIRT_BROWN['base'])
+            tile[mid_y:] = DIRT_BROWN['base']
             
             # Grass portion (top)
-            draw.rectangle([x0, y0, x0 + size - 1, mid_y - 1], 
-                         fill=GRASS_GREEN['base'])
+            tile[:mid_y] = GRASS_GREEN['base']
             
-            # Add transition detail
-            for x in range(x0, x0 + size):
-                if random.random() < 0.3:  # 30% chance of grass overhang
-                    overhang_y = mid_y + random.randint(0, 2)
-                    if overhang_y < y0 + size:
-                        draw.point((x, overhang_y), fill=GRASS_GREEN['dark'])
+            # Add transition detail: 30% of columns get a grass overhang
+            overhang = self.rng.random(size) < 0.3
+            overhang_y = mid_y + self.rng.integers(0, 3, size)
+            overhang &= overhang_y < size
+            tile[overhang_y[overhang], np.flatnonzero(overhang)] = GRASS_GREEN['dark']
+        
+        paste_array(draw, tile, x0, y0)
     
     def _generate_sand(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
         """Sandy texture"""
-        draw_speckled_pattern(draw, x0, y0, size, SAND_YELLOW, density=4, variation=15)
+        paste_array(draw, self._speckled_tile(size, SAND_YELLOW, density=4, variation=15), x0, y0)
     
     def _generate_gravel(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
         """Gravel - mixed small stones"""
-        base_color = (120, 110, 100, 255)
-        draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=base_color)
+        tile = np.empty((size, size, 4), dtype=np.uint8)
+        tile[:] = _GRAVEL_BASE
         
         # Add various colored pebbles
-        pebble_colors = [
-            (140, 130, 120, 255),  # Light gray
-            (100, 90, 80, 255),    # Dark gray
-            (130, 115, 95, 255),   # Brown
-            (110, 105, 100, 255)   # Medium gray
-        ]
+        count = self._counts_for(size)['gravel']
+        colors = _PEBBLE_COLORS[self.rng.integers(0, len(_PEBBLE_COLORS), count)]
         
-        for _ in range(size // 2):
-            px = random.randint(x0, x0 + size - 1)
-            py = random.randint(y0, y0 + size - 1)
-            pebble_color = random.choice(pebble_colors)
-            
-            # Draw small pebble (1-3 pixels)
-            pebble_size = random.randint(1, 3)
-            for dx in range(pebble_size):
-                for dy in range(pebble_size):
-                    if px + dx < x0 + size and py + dy < y0 + size:
-                        draw.point((px + dx, py + dy), fill=pebble_color)
-    
-    def _generate_clay(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        """Clay texture"""
-        self.ceramic_gen.generate_raw_clay(draw, x0, y0, size, face)
+        # Small pebbles (1-3 pixels square), placed so they always fit
+        # inside the tile
+        pebble_size = np.minimum(self.rng.integers(1, 4, count), size)
+        px, py = self.rng.integers(0, size - pebble_size + 1, (2, count))
+        
+        # Draw them as one masked write over every pebble's 3x3 stamp
+        dx = np.arange(3)[None, None, :]
+        dy = np.arange(3)[None, :, None]
+        xs, ys = np.broadcast_arrays(px[:, None, None] + dx, py[:, None, None] + dy)
+        pebble_size = pebble_size[:, None, None]
+        inside = (dx < pebble_size) & (dy < pebble_size)
+        # Boolean masks flatten pebble by pebble, so later pebbles still win
+        tile[ys[inside], xs[inside]] = np.broadcast_to(colors[:, None, None], (count, 3, 3, 4))[inside]
+        paste_array(draw, tile, x0, y0)
     
     def _generate_bedrock(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
         """Indestructible bedrock"""
-        draw_speckled_pattern(draw, x0, y0, size, BEDROCK_DARK, density=10, variation=10)
+        tile = self._speckled_tile(size, BEDROCK_DARK, density=10, variation=10)
         
         # Add some crystalline flecks for magical appearance
-        for _ in range(size // 8):
-            fx = random.randint(x0, x0 + size - 1)
-            fy = random.randint(y0, y0 + size - 1)
-            fleck_color = (80, 80, 120, 255)  # Slightly blue tint
-            draw.point((fx, fy), fill=fleck_color)
+        self._scatter_flecks(tile, self._counts_for(size)['bedrock'], _BEDROCK_FLECK)
+        paste_array(draw, tile, x0, y0)
     
     def _generate_topsoil(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
         """Rich topsoil"""
-        draw_speckled_pattern(draw, x0, y0, size, TOPSOIL_RICH, density=6, variation=20)
+        tile = self._speckled_tile(size, TOPSOIL_RICH, density=6, variation=20)
         
         # Add organic matter
-        for _ in range(size // 6):
-            ox = random.randint(x0, x0 + size - 1)
-            oy = random.randint(y0, y0 + size - 1)
-            organic_color = (40, 25, 15, 255)  # Dark organic matter
-            draw.point((ox, oy), fill=organic_color)
+        self._scatter_flecks(tile, self._counts_for(size)['topsoil'], _TOPSOIL_ORGANIC)
+        paste_array(draw, tile, x0, y0)
     
     def _generate_subsoil(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
         """Poor subsoil"""
-        draw_speckled_pattern(draw, x0, y0, size, SUBSOIL_PALE, density=8, variation=15)
-    
-    # Stone Varieties (10-19)
-    def _generate_granite(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.stone_gen.generate_granite(draw, x0, y0, size, face)
-    
-    def _generate_limestone(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.stone_gen.generate_limestone(draw, x0, y0, size, face)
-    
-    def _generate_marble(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.stone_gen.generate_marble(draw, x0, y0, size, face)
-    
-    def _generate_sandstone(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.stone_gen.generate_sandstone(draw, x0, y0, size, face)
-    
-    def _generate_slate(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.stone_gen.generate_slate(draw, x0, y0, size, face)
-    
-    def _generate_basalt(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.stone_gen.generate_basalt(draw, x0, y0, size, face)
-    
-    def _generate_quartzite(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.stone_gen.generate_quartzite(draw, x0, y0, size, face)
-    
-    def _generate_obsidian(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.stone_gen.generate_obsidian(draw, x0, y0, size, face)
-    
-    def _generate_pumice(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.stone_gen.generate_pumice(draw, x0, y0, size, face)
-    
-    def _generate_shale(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.stone_gen.generate_shale(draw, x0, y0, size, face)
-    
-    # Ores & Minerals (20-29)
-    def _generate_coal_ore(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.ore_gen.generate_coal_ore(draw, x0, y0, size, face)
-    
-    def _generate_iron_ore(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.ore_gen.generate_iron_ore(draw, x0, y0, size, face)
-    
-    def _generate_copper_ore(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.ore_gen.generate_copper_ore(draw, x0, y0, size, face)
-    
-    def _generate_tin_ore(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.ore_gen.generate_tin_ore(draw, x0, y0, size, face)
-    
-    def _generate_silver_ore(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.ore_gen.generate_silver_ore(draw, x0, y0, size, face)
-    
-    def _generate_gold_ore(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.ore_gen.generate_gold_ore(draw, x0, y0, size, face)
-    
-    def _generate_gem_ruby(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.crystal_gen.generate_ruby(draw, x0, y0, size, face)
-    
-    def _generate_gem_sapphire(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.crystal_gen.generate_sapphire(draw, x0, y0, size, face)
-    
-    def _generate_gem_emerald(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.crystal_gen.generate_emerald(draw, x0, y0, size, face)
-    
-    def _generate_gem_diamond(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.crystal_gen.generate_diamond(draw, x0, y0, size, face)
-    
-    # Wood types (30-33)
-    def _generate_wood_oak(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.wood_gen.generate_oak(draw, x0, y0, size, face)
-    
-    def _generate_wood_pine(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.wood_gen.generate_pine(draw, x0, y0, size, face)
-    
-    def _generate_wood_birch(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.wood_gen.generate_birch(draw, x0, y0, size, face)
-    
-    def _generate_wood_mahogany(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.wood_gen.generate_mahogany(draw, x0, y0, size, face)
-    
-    # Leaves (34-37)
-    def _generate_leaves_oak(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.organic_gen.generate_oak_leaves(draw, x0, y0, size, face)
-    
-    def _generate_leaves_pine(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.organic_gen.generate_pine_needles(draw, x0, y0, size, face)
-    
-    def _generate_leaves_birch(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.organic_gen.generate_birch_leaves(draw, x0, y0, size, face)
-    
-    def _generate_leaves_palm(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.organic_gen.generate_palm_fronds(draw, x0, y0, size, face)
-    
-    # Mushrooms (38-39)
-    def _generate_mushroom_brown(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.organic_gen.generate_brown_mushroom(draw, x0, y0, size, face)
-    
-    def _generate_mushroom_red(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.organic_gen.generate_red_mushroom(draw, x0, y0, size, face)
-    
-    # Biome specific (40-49)
-    def _generate_snow(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.special_gen.generate_snow(draw, x0, y0, size, face)
-    
-    def _generate_ice(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.special_gen.generate_ice(draw, x0, y0, size, face)
-    
-    def _generate_packed_ice(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.special_gen.generate_packed_ice(draw, x0, y0, size, face)
-    
-    def _generate_cactus(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.organic_gen.generate_cactus(draw, x0, y0, size, face)
-    
-    def _generate_jungle_vine(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.organic_gen.generate_jungle_vine(draw, x0, y0, size, face)
-    
-    def _generate_coral_pink(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.organic_gen.generate_pink_coral(draw, x0, y0, size, face)
-    
-    def _generate_coral_blue(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.organic_gen.generate_blue_coral(draw, x0, y0, size, face)
-    
-    def _generate_seaweed(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.organic_gen.generate_seaweed(draw, x0, y0, size, face)
-    
-    def _generate_tundra_moss(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.organic_gen.generate_tundra_moss(draw, x0, y0, size, face)
-    
-    def _generate_desert_rock(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.stone_gen.generate_desert_rock(draw, x0, y0, size, face)
-    
-    # Fluids (50-59)
-    def _generate_water(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.fluid_gen.generate_water(draw, x0, y0, size, face)
-    
-    def _generate_lava(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.fluid_gen.generate_lava(draw, x0, y0, size, face)
-    
-    def _generate_oil(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.fluid_gen.generate_oil(draw, x0, y0, size, face)
-    
-    def _generate_acid(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.fluid_gen.generate_acid(draw, x0, y0, size, face)
-    
-    def _generate_honey(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.fluid_gen.generate_honey(draw, x0, y0, size, face)
-    
-    def _generate_steam(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.fluid_gen.generate_steam(draw, x0, y0, size, face)
-    
-    def _generate_toxic_gas(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.fluid_gen.generate_toxic_gas(draw, x0, y0, size, face)
-    
-    def _generate_natural_gas(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.fluid_gen.generate_natural_gas(draw, x0, y0, size, face)
-    
-    def _generate_magical_mist(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.fluid_gen.generate_magical_mist(draw, x0, y0, size, face)
-    
-    def _generate_smoke(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
-        self.fluid_gen.generate_smoke(draw, x0, y0, size, face)
+        paste_array(draw, self._speckled_tile(size, SUBSOIL_PALE, density=8, variation=15), x0, y0)
     
     def _generate_placeholder(self, draw: ImageDraw.Draw, x0: int, y0: int, size: int, face: str):
         """Placeholder for unmapped voxel types"""
+        tile = self._placeholder_tile if size == self.tile_size else self._render_placeholder(size)
+        paste_array(draw, tile, x0, y0)
+    
+    @staticmethod
+    def _render_placeholder(size: int) -> np.ndarray:
+        """Render the placeholder tile as a (size, size, 4) RGBA array."""
         # Pink/magenta placeholder to easily identify missing textures
-        draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], 
-                      fill=(255, 0, 255, 255))
+        img = Image.new('RGBA', (size, size), _PLACEHOLDER_BASE)
+        draw = ImageDraw.Draw(img)
         
         # Add diagonal lines to make it obvious
         for i in range(0, size, 4):
-            draw.line([(x0 + i, y0), (x0, y0 + i)], fill=(200, 0, 200, 255))
-            draw.line([(x0 + size - 1, y0 + i), (x0 + size - 1 - i, y0 + size - 1)], 
-                     fill=(200, 0, 200, 255))
+            draw.line([(i, 0), (0, i)], fill=_PLACEHOLDER_DIAG)
+            draw.line([(size - 1, i), (size - 1 - i, size - 1)], fill=_PLACEHOLDER_DIAG)
+        return np.array(img)
+
+def _generate_faces_job(job: Tuple[int, int, int]) -> Dict[str, Tuple[str, bytes]]:
+    """Worker entry point for TextureCoordinator.generate_all_textures_parallel."""
+    tile_size, seed, voxel_type_id = job
+    faces = TextureCoordinator(tile_size, seed).generate_faces(voxel_type_id)
+    # Raw pixel bytes pickle far cheaper than Images; faces sharing an
+    # Image share one payload, which pickling preserves
+    payloads = {}
+    for image in faces.values():
+        if id(image) not in payloads:
+            payloads[id(image)] = (image.mode, image.tobytes())
+    return {face: payloads[id(image)] for face, image in faces.items()}
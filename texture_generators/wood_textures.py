@@ -6,10 +6,20 @@ Generators for wood types with distinct grain patterns and colors.
 Each wood type has unique characteristics for bark and grain.
 """
 
+import random
 from PIL import ImageDraw
+from typing import Optional
 from texture_generators.base_patterns import draw_grain_pattern
 from texture_generators.color_palettes import get_palette
 
+# Bamboo has no entry in color_palettes; built once at import
+_BAMBOO_PALETTE = {
+    'base': (220, 200, 140, 255),
+    'grain_dark': (180, 160, 100, 255),
+    'grain_light': (240, 220, 160, 255),
+    'segment': (160, 140, 80, 255)
+}
+
 def generate_oak_wood(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
     """Oak wood with classic brown grain pattern."""
     palette = get_palette('oak_wood')
@@ -20,48 +30,51 @@ def generate_pine_wood(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> Non
     palette = get_palette('pine_wood')
     draw_grain_pattern(draw, x0, y0, size, palette, grain_direction='vertical', line_variation=1)
 
-def generate_birch_wood(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
-    """Birch wood with pale color and distinctive bark spots."""
+def generate_birch_wood(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
+                        rng: Optional[random.Random] = None) -> None:
+    """Birch wood with pale color and distinctive bark spots.
+    
+    rng (also taken by mahogany and bamboo) draws the spots and defaults to
+    the random module; the shared grain pattern still uses the module.
+    """
     palette = get_palette('birch_wood')
     draw_grain_pattern(draw, x0, y0, size, palette, grain_direction='vertical', line_variation=1)
     
     # Add characteristic birch bark spots
-    import random
+    if rng is None:
+        rng = random
     spot_color = palette.get('bark_spot', (180, 170, 140, 255))
     for _ in range(size // 3):
-        sx = random.randint(x0, x0 + size - 1)
-        sy = random.randint(y0, y0 + size - 1)
-        spot_width = random.randint(2, max(2, size // 4))
-        spot_height = random.randint(1, 2)
+        spot_width = min(size, rng.randint(2, max(2, size // 4)))
+        spot_height = min(size, rng.randint(1, 2))
+        # Place the spot so it always fits inside the tile
+        sx = rng.randint(x0, x0 + size - spot_width)
+        sy = rng.randint(y0, y0 + size - spot_height)
         
         # Draw horizontal bark lines
-        for i in range(spot_width):
-            for j in range(spot_height):
-                px = max(x0, min(x0 + size - 1, sx + i))
-                py = max(y0, min(y0 + size - 1, sy + j))
-                draw.point((px, py), fill=spot_color)
+        draw.rectangle([sx, sy, sx + spot_width - 1, sy + spot_height - 1], fill=spot_color)
 
-def generate_mahogany_wood(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
+def generate_mahogany_wood(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
+                           rng: Optional[random.Random] = None) -> None:
     """Mahogany wood with rich, deep red-brown coloring."""
     palette = get_palette('mahogany_wood')
     draw_grain_pattern(draw, x0, y0, size, palette, grain_direction='vertical', line_variation=2)
     
     # Add rich wood tones
-    import random
+    if rng is None:
+        rng = random
     rich_color = palette.get('rich_tone', (140, 70, 50, 255))
+    points = []
     for _ in range(size // 4):
-        rx = random.randint(x0, x0 + size - 1)
-        ry = random.randint(y0, y0 + size - 1)
-        draw.point((rx, ry), fill=rich_color)
+        rx = rng.randint(x0, x0 + size - 1)
+        ry = rng.randint(y0, y0 + size - 1)
+        points.append((rx, ry))
+    draw.point(points, fill=rich_color)
 
-def generate_bamboo_wood(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> None:
+def generate_bamboo_wood(draw: ImageDraw.Draw, x0: int, y0: int, size: int,
+                         rng: Optional[random.Random] = None) -> None:
     """Bamboo with segmented, hollow appearance."""
-    palette = {
-        'base': (220, 200, 140, 255),
-        'grain_dark': (180, 160, 100, 255),
-        'grain_light': (240, 220, 160, 255),
-        'segment': (160, 140, 80, 255)
-    }
+    palette = _BAMBOO_PALETTE
     
     # Base bamboo color
     draw.rectangle([x0, y0, x0 + size - 1, y0 + size - 1], fill=palette['base'])
@@ -70,19 +83,17 @@ def generate_bamboo_wood(draw: ImageDraw.Draw, x0: int, y0: int, size: int) -> N
     draw_grain_pattern(draw, x0, y0, size, palette, grain_direction='vertical', line_variation=1)
     
     # Add bamboo segments (horizontal lines)
-    import random
-    segment_count = random.randint(1, 3)
+    if rng is None:
+        rng = random
+    segment_count = rng.randint(1, 3)
     for i in range(segment_count):
         segment_y = y0 + (size // (segment_count + 1)) * (i + 1)
-        segment_y += random.randint(-1, 1)
+        segment_y += rng.randint(-1, 1)
         segment_y = max(y0, min(y0 + size - 1, segment_y))
         
-        # Draw segment line across width
-        for x in range(x0, x0 + size):
-            draw.point((x, segment_y), fill=palette['segment'])
-            # Add thickness
-            if segment_y + 1 < y0 + size:
-                draw.point((x, segment_y + 1), fill=palette['segment'])
+        # Draw segment line across width, two pixels thick where it fits
+        segment_bottom = min(segment_y + 1, y0 + size - 1)
+        draw.rectangle([x0, segment_y, x0 + size - 1, segment_bottom], fill=palette['segment'])
 
 # Lookup table for wood generators
 WOOD_GENERATORS = {
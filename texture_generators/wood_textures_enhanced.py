@@ -8,9 +8,64 @@ Enhanced for 25cm×25cm voxel scale for detailed grain and bark visibility.
 """
 
 from PIL import Image, ImageDraw
+import functools
+import math
 import random
-from texture_generators.base_patterns import draw_grain_pattern, draw_speckled_pattern, draw_mottled_pattern
-from texture_generators.color_palettes import get_palette, vary_color, blend_colors
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional, Tuple
+from texture_generators.base_patterns import draw_mottled_pattern, grain_array, paste_array, speckle_array
+from texture_generators.color_palettes import get_palette, vary_color
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+def _frozen(values, dtype=np.intp) -> np.ndarray:
+    """Read-only array for the module-level pattern tables."""
+    arr = np.array(values, dtype=dtype)
+    arr.flags.writeable = False
+    return arr
+
+# Fixed stamp patterns; every bark and plank feature is deterministic
+_OAK_FURROW_OFFSETS = _frozen([-2, 1, -1, 2, 0, -2, 1])
+_OAK_FURROW_WAVE = _frozen([0, -1, 1, 0, -1, 0, 1, -1, 0])
+_OAK_RIDGES = _frozen([(3, 5, 3), (7, 2, 2), (12, 8, 4), (5, 12, 3), (10, 4, 2)])  # (x, y, size)
+_BIRCH_LINE_OFFSETS = _frozen([-1, 0, 1, 0, -1, 1, 0])
+_BIRCH_BREAK_MASK = _frozen([True, True, False, True, True, True, False, True], bool)
+_BIRCH_SPOTS = _frozen([(2, 3), (7, 1), (4, 8), (11, 5), (1, 11), (9, 2), (6, 9), (13, 7)])  # (x, y)
+_PLANK_SAW_OFFSETS = _frozen([-1, 0, 1, 0, -1, 1])
+_PLANK_MARK_MASK = _frozen([False, False, True, False, False, False, True, False, True, False], bool)
+_PLANK_EDGE_MASK = _frozen([True, False, True, True, False, True], bool)
+
+@functools.lru_cache(maxsize=None)
+def _mahogany_variation_dots(texture_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(ys, xs, color index) of the mahogany color variation dots, in drawing order."""
+    i = np.arange(texture_size * texture_size // 8)
+    return _frozen((i * 5 + 2) % texture_size), _frozen((i * 3 + 1) % texture_size), _frozen(i % 2)
+
+@functools.lru_cache(maxsize=None)
+def _variation_lut(color, variation: int) -> np.ndarray:
+    """Lookup table of vary_color(color, variation, seed), one row per seed residue.
+    
+    Each channel offset is taken modulo 2 * |variation| + 1, which is
+    therefore also the period of the output in the seed.
+    """
+    period = 2 * abs(variation) + 1
+    lut = np.array([vary_color(color, variation, seed) for seed in range(period)], dtype=np.uint8)
+    lut.flags.writeable = False
+    return lut
+
+def _vary_color_array(color, variation: int, seed_offsets: np.ndarray) -> np.ndarray:
+    """vary_color for an array of seed offsets, as an RGBA uint8 array of the same shape plus 4."""
+    lut = _variation_lut(color, variation)
+    return lut[seed_offsets % len(lut)]
+
+def _blend_rgba_arr(color1, color2, ratio: np.ndarray) -> np.ndarray:
+    """Array version of blend_colors: one uint8 RGBA blend per element of ratio."""
+    t = np.clip(ratio, 0.0, 1.0)[..., None]
+    return (np.asarray(color1) * (1 - t) + np.asarray(color2) * t).astype(np.uint8)
 
 def generate_wood_texture(texture_size: int = 16, wood_type: str = 'oak', face_type: str = 'side') -> Image.Image:
     """
@@ -24,31 +79,101 @@ def generate_wood_texture(texture_size: int = 16, wood_type: str = 'oak', face_t
     Returns:
         PIL Image with wood texture
     """
-    image = Image.new('RGBA', (texture_size, texture_size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(image)
+    end_grain = face_type in ['top', 'bottom']
+    if end_grain or wood_type in _DETERMINISTIC_BARK:
+        # Top and bottom share one end grain render
+        pixels = _generate_wood_texture_cached(texture_size, wood_type, end_grain)
+        return Image.frombytes('RGBA', (texture_size, texture_size), pixels)
+    return _render_wood_texture(texture_size, wood_type, end_grain)
+
+# Bark patterns that use no randomness; the others draw speckles or grain
+# from the random module and must be rendered on every call
+_DETERMINISTIC_BARK = frozenset({'pine', 'birch'})
+
+@functools.lru_cache(maxsize=64)
+def _generate_wood_texture_cached(texture_size: int, wood_type: str, end_grain: bool) -> bytes:
+    """Render a deterministic wood texture once per (texture_size, wood_type, end_grain).
     
+    Returns raw RGBA bytes rather than an Image so callers can never mutate
+    the cached result.
+    """
+    return _render_wood_texture(texture_size, wood_type, end_grain).tobytes()
+
+def clear_texture_cache() -> None:
+    """Drop all cached wood textures."""
+    _generate_wood_texture_cached.cache_clear()
+
+def _render_wood_texture(texture_size: int, wood_type: str, end_grain: bool) -> Image.Image:
+    """Render a wood texture (see generate_wood_texture)."""
     palette = get_palette(f'{wood_type}_wood')
     
-    if face_type in ['top', 'bottom']:
+    # Start from the base color; patterns that cover the whole tile simply
+    # paint over it. Both passes write into this one buffer, which becomes
+    # the image without an intermediate paste
+    tile = np.empty((texture_size, texture_size, 4), dtype=np.uint8)
+    tile[:] = palette['base']
+    
+    if end_grain:
         # End grain pattern - visible tree rings at 25cm scale
-        generate_end_grain_pattern(draw, texture_size, palette, wood_type)
+        _fill_end_grain(tile, palette, wood_type)
     else:
         # Side bark pattern - completely different per species
-        generate_bark_pattern(draw, texture_size, palette, wood_type)
+        _fill_bark(tile, palette, wood_type)
+    
+    return Image.fromarray(tile)
+
+def _end_grain_ring_distance(texture_size: int, center_x: int, center_y: int,
+                             ring_radii: np.ndarray, distortion_factor: float) -> np.ndarray:
+    """Distance from each pixel's distorted radius to the nearest tree ring.
+    
+    Plain loops so numba can compile it; the NumPy path in
+    _fill_end_grain computes the same thing.
+    """
+    ring_distance = np.empty((texture_size, texture_size))
+    for y in range(texture_size):
+        for x in range(texture_size):
+            dx = x - center_x
+            dy = y - center_y
+            # Deterministic wobble around the true radius
+            organic_distance = math.sqrt(dx * dx + dy * dy) + distortion_factor * math.sin(math.atan2(dy, dx) * 8)
+            nearest = abs(organic_distance - ring_radii[0])
+            for radius in ring_radii[1:]:
+                # Radii are increasing: past the pixel, the distance only grows
+                if radius - organic_distance >= nearest:
+                    break
+                nearest = min(nearest, abs(organic_distance - radius))
+            ring_distance[y, x] = nearest
+    return ring_distance
+
+@functools.lru_cache(maxsize=None)
+def _end_grain_wobble(texture_size: int) -> np.ndarray:
+    """sin(8 * angle) of every pixel around the tile center, for the NumPy end grain path.
     
-    return image
+    Uses the math module like the kernel above: np.arctan2 can differ from
+    math.atan2 in the last bit, which moves the odd pixel across a ring edge.
+    """
+    center = texture_size // 2
+    wobble = np.array([[math.sin(math.atan2(y - center, x - center) * 8) for x in range(texture_size)]
+                       for y in range(texture_size)])
+    wobble.flags.writeable = False
+    return wobble
+
+# Compiled end grain kernel when numba is installed, otherwise the NumPy path
+_end_grain_ring_distance_jit = numba.njit(cache=True)(_end_grain_ring_distance) if numba is not None else None
 
 def generate_end_grain_pattern(draw: ImageDraw.Draw, texture_size: int, palette: dict, wood_type: str) -> None:
     """Generate realistic end grain (top/bottom face) showing multiple smooth concentric tree rings (Lebensringe)."""
-    import math
-    
+    tile = np.empty((texture_size, texture_size, 4), dtype=np.uint8)
+    _fill_end_grain(tile, palette, wood_type)
+    paste_array(draw, tile, 0, 0)
+
+def _fill_end_grain(tile: np.ndarray, palette: dict, wood_type: str) -> None:
+    """Array version of generate_end_grain_pattern: fills a (size, size, 4) uint8 tile in place."""
+    texture_size = tile.shape[0]
     base_color = palette['base']
     ring_color = palette['grain_dark']
     light_ring_color = palette['grain_light']
     
-    # Fill base
-    draw.rectangle([0, 0, texture_size-1, texture_size-1], fill=base_color)
-    
     # Center the rings for clean appearance
     center_x = texture_size // 2
     center_y = texture_size // 2
@@ -66,62 +191,61 @@ def generate_end_grain_pattern(draw: ImageDraw.Draw, texture_size: int, palette:
         # Fixed spacing - no randomness
         current_radius += ring_spacing
     
-    # Draw smooth concentric rings
-    for y in range(texture_size):
-        for x in range(texture_size):
-            dx = x - center_x
-            dy = y - center_y
-            distance = math.sqrt(dx * dx + dy * dy)
-            
-            # Very minimal organic distortion for naturalness - deterministic based on position
-            angle = math.atan2(dy, dx)
-            # Use deterministic pattern based on wood type and position
-            distortion_factor = {'oak': 0.1, 'pine': 0.05, 'birch': 0.15, 'mahogany': 0.08}.get(wood_type, 0.1)
-            distortion = distortion_factor * math.sin(angle * 8)  # Deterministic wobble
-            organic_distance = distance + distortion
-            
-            # Determine if we're on a ring boundary (dark line)
-            is_ring_line = False
-            ring_intensity = 0.0
-            
-            for radius in ring_radii:
-                # Distance from ring line
-                ring_distance = abs(organic_distance - radius)
-                
-                # Ring line thickness (1.0 pixels for clean appearance)
-                ring_thickness = 0.8
-                
-                if ring_distance <= ring_thickness:
-                    is_ring_line = True
-                    # Smooth falloff from ring center to edge
-                    ring_intensity = max(ring_intensity, 1.0 - (ring_distance / ring_thickness))
-                    break
-            
-            # Color the pixel
-            if is_ring_line:
-                # Smooth blend from base color to dark ring color
-                color = blend_colors(base_color, ring_color, ring_intensity * 0.7)
-            else:
-                # Base wood color with minimal variation
-                color = vary_color(base_color, 15, x + y)
-            
-            draw.point((x, y), fill=color)
+    # Very minimal organic distortion for naturalness - deterministic based on position
+    distortion_factor = {'oak': 0.1, 'pine': 0.05, 'birch': 0.15, 'mahogany': 0.08}.get(wood_type, 0.1)
+    
+    # Base wood color with minimal variation; vary_color only depends on x + y
+    ys, xs = np.mgrid[0:texture_size, 0:texture_size]
+    tile[:] = _vary_color_array(base_color, 15, xs + ys)
+    
+    if ring_radii:
+        if _end_grain_ring_distance_jit is not None:
+            ring_distance = _end_grain_ring_distance_jit(texture_size, center_x, center_y,
+                                                         np.array(ring_radii), distortion_factor)
+        else:
+            # Same computation over the whole tile at once
+            dy, dx = ys - center_y, xs - center_x
+            organic_distance = np.sqrt(dx * dx + dy * dy) + distortion_factor * _end_grain_wobble(texture_size)
+            # Radii are increasing, so the nearest ring is one of the two
+            # around each pixel's insertion point
+            radii = np.array(ring_radii)
+            upper = np.minimum(np.searchsorted(radii, organic_distance), len(radii) - 1)
+            lower = np.maximum(upper - 1, 0)
+            ring_distance = np.minimum(np.abs(organic_distance - radii[lower]),
+                                       np.abs(organic_distance - radii[upper]))
+        
+        # Ring line thickness (1.0 pixels for clean appearance)
+        ring_thickness = 0.8
+        # Ring spacing is wider than twice the line thickness, so the
+        # nearest ring is the only one a pixel can be on
+        on_ring = ring_distance <= ring_thickness
+        
+        # Smooth blend from base color to dark ring color
+        ring_blend = _blend_rgba_arr(base_color, ring_color, (1.0 - ring_distance / ring_thickness) * 0.7)
+        np.copyto(tile, ring_blend, where=on_ring[..., None])
     
     # Add very subtle wood grain texture that doesn't interfere with rings
     grain_count = texture_size * texture_size // 64  # Minimal grain
-    # Fixed positions for deterministic grain
-    grain_positions = [(i * 7 + 3) % texture_size for i in range(grain_count)]
-    for i in range(grain_count):
-        grain_x = grain_positions[i]
-        grain_y = grain_positions[(i * 3 + 5) % grain_count] % texture_size
-        
-        # Deterministic grain pattern (every other grain)
-        if i % 2 == 0:
-            color = vary_color(base_color, 10, x + y * 2)
-            draw.point((grain_x, grain_y), fill=color)
+    if grain_count:
+        # Fixed positions for deterministic grain (every other grain)
+        grain_positions = (np.arange(grain_count) * 7 + 3) % texture_size
+        grain_index = np.arange(0, grain_count, 2)
+        grain_x = grain_positions[grain_index]
+        grain_y = grain_positions[(grain_index * 3 + 5) % grain_count] % texture_size
+        # Grain color is keyed off the last pixel of the ring pass
+        last = texture_size - 1
+        tile[grain_y, grain_x] = vary_color(base_color, 10, last + last * 2)
 
 def generate_bark_pattern(draw: ImageDraw.Draw, texture_size: int, palette: dict, wood_type: str) -> None:
     """Generate species-specific bark patterns - COMPLETELY DIFFERENT per species."""
+    tile = np.empty((texture_size, texture_size, 4), dtype=np.uint8)
+    tile[:] = palette['base']
+    _fill_bark(tile, palette, wood_type)
+    paste_array(draw, tile, 0, 0)
+
+def _fill_bark(tile: np.ndarray, palette: dict, wood_type: str) -> None:
+    """Array version of generate_bark_pattern: paints the bark over a (size, size, 4) uint8 tile in place."""
+    texture_size = tile.shape[0]
     
     if wood_type == 'oak':
         # Oak bark: Deep furrows, blocky pattern, rough texture
@@ -130,36 +254,34 @@ def generate_bark_pattern(draw: ImageDraw.Draw, texture_size: int, palette: dict
         ridge_color = palette['grain_light']
         
         # Base rough texture
-        draw_speckled_pattern(draw, 0, 0, texture_size, palette, density=4, variation=30)
+        speckle_array(tile, palette, density=4, variation=30)
         
         # Deep vertical furrows characteristic of oak
         num_furrows = max(2, texture_size // 6)
-        furrow_offsets = [-2, 1, -1, 2, 0, -2, 1]  # Fixed offsets pattern
-        for i in range(num_furrows):
-            furrow_x = (texture_size // (num_furrows + 1)) * (i + 1)
-            furrow_x += furrow_offsets[i % len(furrow_offsets)]
-            
-            # Draw irregular vertical furrow
-            y_pattern = [0, -1, 1, 0, -1, 0, 1, -1, 0]  # Fixed pattern for irregularity
-            for y in range(texture_size):
-                if y % 5 != 2:  # Skip some pixels for irregular furrow (deterministic)
-                    fx = furrow_x + y_pattern[y % len(y_pattern)]
-                    fx = max(0, min(texture_size-1, fx))
-                    draw.point((fx, y), fill=furrow_color)
-                    
-                    # Add furrow depth
-                    if fx + 1 < texture_size and y % 3 != 1:  # Deterministic depth pattern
-                        draw.point((fx + 1, y), fill=vary_color(furrow_color, -20, fx + y))
+        furrow_index = np.arange(num_furrows)
+        furrow_x = (texture_size // (num_furrows + 1)) * (furrow_index + 1)
+        furrow_x += _OAK_FURROW_OFFSETS[furrow_index % len(_OAK_FURROW_OFFSETS)]
+        
+        # Irregular vertical furrows, skipping some rows (deterministic)
+        ys = np.flatnonzero(np.arange(texture_size) % 5 != 2)
+        fx = np.clip(furrow_x[:, None] + _OAK_FURROW_WAVE[ys % len(_OAK_FURROW_WAVE)], 0, texture_size - 1)
+        fy = np.broadcast_to(ys, fx.shape)
+        
+        # Each furrow pixel is followed by a depth pixel to its right where
+        # it fits (deterministic depth pattern); stacking the pairs keeps the
+        # original drawing order, so later furrows still win on overlap
+        has_depth = (fx + 1 < texture_size) & (fy % 3 != 1)
+        keep = np.stack([np.ones_like(has_depth), has_depth], axis=-1)
+        xs = np.stack([fx, fx + 1], axis=-1)
+        colors = np.stack([np.broadcast_to(np.array(furrow_color, dtype=np.uint8), fx.shape + (4,)),
+                           _vary_color_array(furrow_color, -20, fx + fy)], axis=-2)
+        tile[np.stack([fy, fy], axis=-1)[keep], xs[keep]] = colors[keep]
         
         # Add blocky ridge patterns
-        ridge_positions = [(3, 5, 3), (7, 2, 2), (12, 8, 4), (5, 12, 3), (10, 4, 2)]
-        for i in range(min(len(ridge_positions), texture_size // 4)):
-            ridge_x, ridge_y, ridge_size = ridge_positions[i]
+        for ridge_x, ridge_y, ridge_size in _OAK_RIDGES[:texture_size // 4].tolist():
             if ridge_x < texture_size - 3 and ridge_y < texture_size - 3:
-                draw.rectangle([ridge_x, ridge_y, 
-                              min(ridge_x + ridge_size, texture_size-1),
-                              min(ridge_y + ridge_size, texture_size-1)], 
-                             fill=ridge_color)
+                tile[ridge_y:min(ridge_y + ridge_size, texture_size - 1) + 1,
+                     ridge_x:min(ridge_x + ridge_size, texture_size - 1) + 1] = ridge_color
     
     elif wood_type == 'pine':
         # Pine bark: Scaly, plated pattern, reddish-brown
@@ -167,33 +289,26 @@ def generate_bark_pattern(draw: ImageDraw.Draw, texture_size: int, palette: dict
         scale_color = palette['grain_dark']
         plate_color = palette['grain_light']
         
-        # Fill base
-        draw.rectangle([0, 0, texture_size-1, texture_size-1], fill=base_color)
-        
         # Draw characteristic scale/plate pattern
         scale_size = max(2, texture_size // 8)
         
-        for y in range(0, texture_size, scale_size):
-            for x in range(0, texture_size, scale_size):
-                # Offset every other row for natural pattern
-                offset_x = (scale_size // 2) if (y // scale_size) % 2 == 1 else 0
-                scale_x = x + offset_x
-                
-                if scale_x < texture_size and y < texture_size:
-                    # Draw individual bark scale
-                    scale_width = min(scale_size, texture_size - scale_x)
-                    scale_height = min(scale_size, texture_size - y)
-                    
-                    # Vary scale color
-                    varied_scale_color = vary_color(scale_color, 20, x + y * 3)
-                    draw.rectangle([scale_x, y, 
-                                  scale_x + scale_width - 1, 
-                                  y + scale_height - 1], 
-                                 fill=varied_scale_color)
-                    
-                    # Add scale edge highlight
-                    if scale_width > 1 and scale_height > 1:
-                        draw.point((scale_x, y), fill=plate_color)
+        # Scale grid cell of every pixel; every other row is offset by half
+        # a scale for a natural pattern, leaving base color at its left edge
+        ys, xs = np.mgrid[0:texture_size, 0:texture_size]
+        scale_row = ys // scale_size
+        offset_x = np.where(scale_row % 2 == 1, scale_size // 2, 0)
+        scale_col = (xs - offset_x) // scale_size
+        
+        # Vary scale color by the cell's unshifted corner
+        scale_colors = _vary_color_array(scale_color, 20, scale_col * scale_size + scale_row * scale_size * 3)
+        np.copyto(tile, scale_colors, where=(xs >= offset_x)[..., None])
+        
+        # Add scale edge highlight at each scale's top-left corner, where
+        # the scale is more than a pixel wide and tall
+        corner_ys = np.arange(0, texture_size - 1, scale_size)
+        for y in corner_ys:
+            corner_x0 = scale_size // 2 if (y // scale_size) % 2 == 1 else 0
+            tile[y, corner_x0:texture_size - 1:scale_size] = plate_color
     
     elif wood_type == 'birch':
         # Birch bark: Smooth white with dark horizontal lines, papery texture
@@ -201,32 +316,28 @@ def generate_bark_pattern(draw: ImageDraw.Draw, texture_size: int, palette: dict
         line_color = palette['grain_dark']  # Dark lines
         spot_color = palette.get('bark_spot', (180, 170, 140, 255))
         
-        # Smooth white base
-        draw.rectangle([0, 0, texture_size-1, texture_size-1], fill=base_color)
+        # Smooth white base comes from the tile
         
         # Characteristic horizontal dark lines
         line_spacing = max(2, texture_size // 6)
-        line_offsets = [-1, 0, 1, 0, -1, 1, 0]  # Fixed pattern for line variation
-        for i, y in enumerate(range(0, texture_size, line_spacing)):
-            line_y = y + line_offsets[i % len(line_offsets)]
-            if 0 <= line_y < texture_size:
-                # Draw horizontal line with breaks
-                break_pattern = [True, True, False, True, True, True, False, True]  # Fixed break pattern
-                for x in range(texture_size):
-                    if break_pattern[x % len(break_pattern)]:  # Deterministic broken line pattern
-                        draw.point((x, line_y), fill=line_color)
-                        
-                        # Sometimes make line thicker (deterministic)
-                        if x % 5 == 2 and line_y + 1 < texture_size:
-                            draw.point((x, line_y + 1), fill=line_color)
+        line_ys = np.arange(0, texture_size, line_spacing)
+        line_ys += _BIRCH_LINE_OFFSETS[np.arange(len(line_ys)) % len(_BIRCH_LINE_OFFSETS)]
+        line_ys = line_ys[(line_ys >= 0) & (line_ys < texture_size)]
+        
+        # Horizontal lines with a fixed break pattern
+        line_xs = np.flatnonzero(_BIRCH_BREAK_MASK[np.arange(texture_size) % len(_BIRCH_BREAK_MASK)])
+        tile[line_ys[:, None], line_xs] = line_color
+        
+        # Make the line thicker every fifth column (deterministic)
+        thick_ys = line_ys[line_ys + 1 < texture_size] + 1
+        thick_xs = line_xs[line_xs % 5 == 2]
+        tile[thick_ys[:, None], thick_xs] = line_color
         
         # Add small dark spots/marks characteristic of birch
         spot_count = texture_size // 4
-        spot_positions = [(2, 3), (7, 1), (4, 8), (11, 5), (1, 11), (9, 2), (6, 9), (13, 7)]
-        for i in range(min(spot_count, len(spot_positions))):
-            spot_x, spot_y = spot_positions[i]
-            if spot_x < texture_size and spot_y < texture_size:
-                draw.point((spot_x, spot_y), fill=spot_color)
+        spot_xs, spot_ys = _BIRCH_SPOTS[:spot_count].T
+        inside = (spot_xs < texture_size) & (spot_ys < texture_size)
+        tile[spot_ys[inside], spot_xs[inside]] = spot_color
     
     elif wood_type == 'mahogany':
         # Mahogany bark: Dark reddish-brown, fine vertical striations
@@ -234,72 +345,99 @@ def generate_bark_pattern(draw: ImageDraw.Draw, texture_size: int, palette: dict
         stripe_color = palette['grain_dark']
         highlight_color = palette['rich_tone']
         
-        # Rich base color
-        draw.rectangle([0, 0, texture_size-1, texture_size-1], fill=base_color)
-        
-        # Fine vertical grain/striations
-        draw_grain_pattern(draw, 0, 0, texture_size, palette, 
-                          grain_direction='vertical', line_variation=1)
+        # Fine vertical grain/striations over the rich base color
+        grain_array(tile, palette, grain_direction='vertical', line_variation=1)
         
-        # Add rich mahogany color variations
-        variation_count = texture_size * texture_size // 8
-        variation_positions = [(i * 3 + 1, i * 5 + 2) for i in range(variation_count)]
-        variation_colors = [highlight_color, vary_color(base_color, 15, 42)]
-        for i in range(variation_count):
-            vx = variation_positions[i][0] % texture_size
-            vy = variation_positions[i][1] % texture_size
-            variation_color = variation_colors[i % len(variation_colors)]
-            draw.point((vx, vy), fill=variation_color)
+        # Add rich mahogany color variations; later dots overwrite earlier ones
+        dot_ys, dot_xs, dot_colors = _mahogany_variation_dots(texture_size)
+        variation_colors = np.array([highlight_color, vary_color(base_color, 15, 42)], dtype=np.uint8)
+        tile[dot_ys, dot_xs] = variation_colors[dot_colors]
     
     else:
         # Default wood grain pattern
-        draw_grain_pattern(draw, 0, 0, texture_size, palette, grain_direction='vertical')
+        grain_array(tile, palette, grain_direction='vertical')
 
 def generate_plank_texture(texture_size: int = 16, wood_type: str = 'oak') -> Image.Image:
     """
     Generate processed wood plank texture with sawing marks.
     Shows individual plank with visible processing marks at 25cm scale.
     """
-    image = Image.new('RGBA', (texture_size, texture_size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(image)
-    
     palette = get_palette(f'{wood_type}_wood')
     base_color = palette['base']
     grain_color = palette['grain_dark']
     saw_mark_color = vary_color(base_color, -30, 123)
     
-    # Base plank color
-    draw.rectangle([0, 0, texture_size-1, texture_size-1], fill=base_color)
-    
-    # Wood grain running along plank length
-    draw_grain_pattern(draw, 0, 0, texture_size, palette, 
-                      grain_direction='horizontal', line_variation=1)
+    # Wood grain running along plank length, over the base plank color
+    tile = np.empty((texture_size, texture_size, 4), dtype=np.uint8)
+    grain_array(tile, palette, grain_direction='horizontal', line_variation=1)
+    xs = np.arange(texture_size)
     
     # Add sawing marks (visible at 25cm scale)
     saw_mark_spacing = max(2, texture_size // 8)
-    saw_offsets = [-1, 0, 1, 0, -1, 1]  # Fixed pattern for saw mark variation
-    for i, y in enumerate(range(0, texture_size, saw_mark_spacing)):
-        saw_y = y + saw_offsets[i % len(saw_offsets)]
-        if 0 <= saw_y < texture_size:
-            # Subtle horizontal saw marks
-            mark_pattern = [False, False, True, False, False, False, True, False, True, False]
-            for x in range(texture_size):
-                if mark_pattern[x % len(mark_pattern)]:  # Deterministic subtle marks
-                    draw.point((x, saw_y), fill=saw_mark_color)
+    saw_ys = np.arange(0, texture_size, saw_mark_spacing)
+    saw_ys += _PLANK_SAW_OFFSETS[np.arange(len(saw_ys)) % len(_PLANK_SAW_OFFSETS)]
+    saw_ys = saw_ys[(saw_ys >= 0) & (saw_ys < texture_size)]
+    # Subtle horizontal saw marks in a deterministic pattern
+    mark_xs = xs[_PLANK_MARK_MASK[xs % len(_PLANK_MARK_MASK)]]
+    tile[saw_ys[:, None], mark_xs] = saw_mark_color
     
     # Add plank edge detail
     edge_color = vary_color(base_color, -20, 456)
     # Top edge - deterministic pattern
-    edge_pattern = [True, False, True, True, False, True]
-    for x in range(texture_size):
-        if edge_pattern[x % len(edge_pattern)]:
-            draw.point((x, 0), fill=edge_color)
-    # Bottom edge  
-    for x in range(texture_size):
-        if edge_pattern[(x + 2) % len(edge_pattern)]:  # Slightly offset pattern
-            draw.point((x, texture_size-1), fill=edge_color)
+    tile[0, xs[_PLANK_EDGE_MASK[xs % len(_PLANK_EDGE_MASK)]]] = edge_color
+    # Bottom edge, slightly offset pattern
+    tile[texture_size - 1, xs[_PLANK_EDGE_MASK[(xs + 2) % len(_PLANK_EDGE_MASK)]]] = edge_color
+    
+    return Image.fromarray(tile)
+
+# Species with dedicated bark and end grain patterns
+WOOD_TYPES = ('oak', 'pine', 'birch', 'mahogany')
+
+def generate_all_wood_textures(texture_size: int = 16, wood_types: Iterable[str] = WOOD_TYPES,
+                               workers: Optional[int] = None) -> Dict[Tuple[str, str], Image.Image]:
+    """
+    Generate the top, bottom, side and plank textures of every wood type.
     
-    return image
+    Textures without randomness (end grain, pine and birch bark) render in a
+    thread pool. The rest draw from the random module, so they render in
+    this thread in a fixed order and random.seed() still reproduces them.
+    
+    Args:
+        texture_size: Size of every texture in pixels
+        wood_types: Wood species to generate; duplicates are generated once
+        workers: Number of worker threads (defaults to the executor's default)
+    
+    Returns:
+        Dict mapping (wood_type, face) -> Image, with face one of 'top',
+        'bottom', 'side' or 'plank'
+    """
+    wood_types = list(dict.fromkeys(wood_types))
+    size = (texture_size, texture_size)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {(wood_type, end_grain): pool.submit(_generate_wood_texture_cached,
+                                                       texture_size, wood_type, end_grain)
+                   for wood_type in wood_types for end_grain in (True, False)
+                   if end_grain or wood_type in _DETERMINISTIC_BARK}
+        
+        # Random-based textures, in the order sequential calls would draw them
+        random_textures = {}
+        for wood_type in wood_types:
+            if wood_type not in _DETERMINISTIC_BARK:
+                random_textures[wood_type, 'side'] = _render_wood_texture(texture_size, wood_type, False)
+            random_textures[wood_type, 'plank'] = generate_plank_texture(texture_size, wood_type)
+        
+        textures = {}
+        for wood_type in wood_types:
+            end_grain = pending[wood_type, True].result()
+            textures[wood_type, 'top'] = Image.frombytes('RGBA', size, end_grain)
+            textures[wood_type, 'bottom'] = Image.frombytes('RGBA', size, end_grain)
+            if wood_type in _DETERMINISTIC_BARK:
+                textures[wood_type, 'side'] = Image.frombytes('RGBA', size, pending[wood_type, False].result())
+            else:
+                textures[wood_type, 'side'] = random_textures[wood_type, 'side']
+            textures[wood_type, 'plank'] = random_textures[wood_type, 'plank']
+    return textures
 
 # Export functions
-__all__ = ['generate_wood_texture', 'generate_plank_texture']
+__all__ = ['generate_wood_texture', 'generate_plank_texture', 'generate_all_wood_textures',
+           'clear_texture_cache']